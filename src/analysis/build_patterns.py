@@ -0,0 +1,25 @@
+"""Prebuild the analyzers' pattern cache.
+
+Usage: python -m src.analysis.build_patterns
+"""
+from .decision_factors import DecisionFactorAnalyzer
+from .demographics import DemographicsAnalyzer
+from .guide_analyzer import GuideAnalyzer
+from .pattern_cache import CACHE_PATH, clear_cache
+from .sentiment import load_lexicon
+
+
+def main():
+    """Rebuild every cached table from scratch and write the cache file."""
+    clear_cache()
+    load_lexicon.cache_clear()
+
+    for analyzer_cls in (DecisionFactorAnalyzer, DemographicsAnalyzer, GuideAnalyzer):
+        analyzer_cls._compile_patterns()
+    load_lexicon()
+
+    print(f"Wrote {CACHE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Per-review text context shared by the analyzers."""
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate
+
+from ..database.models import Review
+
+# Folds every sentence delimiter (. ! ?) into "." so str.split can cut on it
+SENTENCE_TRANS = str.maketrans("!?", "..")
+
+
+@dataclass
+class ReviewContext:
+    """A review's analyzable text with derived forms computed on first use."""
+    text: str
+
+    @classmethod
+    def from_review(cls, review: Review) -> "ReviewContext":
+        return cls(text=f"{review.title} {review.text}")
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self) -> list[str]:
+        return self.text.split()
+
+    @cached_property
+    def token_count(self) -> int:
+        return len(self.tokens)
+
+    @cached_property
+    def sentence_bounds(self) -> tuple[list[int], list[int]]:
+        """Start and end offsets of each sentence in text."""
+        pieces = self.text.translate(SENTENCE_TRANS).split(".")
+        piece_starts = accumulate((len(piece) + 1 for piece in pieces), initial=0)
+        last = len(pieces) - 1
+
+        starts = []
+        ends = []
+        for i, (piece, start) in enumerate(zip(pieces, piece_starts)):
+            # Runs of delimiters count as one break, as with re.split(r'[.!?]+')
+            if piece or i == 0 or i == last:
+                starts.append(start)
+                ends.append(start + len(piece))
+        return starts, ends
+
+    @cached_property
+    def sentences(self) -> list[str]:
+        """Sentences of text, unstripped, as re.split on the delimiters gives them."""
+        starts, ends = self.sentence_bounds
+        return [self.text[start:end] for start, end in zip(starts, ends)]
@@ -1,18 +1,29 @@
 """Analyzer for purchasing decision factors in safari reviews."""
-import re
-import json
-from typing import Optional
+from bisect import bisect_right
+from dataclasses import replace
+from itertools import accumulate, chain, islice
+from typing import ClassVar, Iterable, Iterator, Optional
 
-from textblob import TextBlob
+import ahocorasick
+import orjson
 
 from ..database.models import Review, DecisionFactor
+from .context import ReviewContext
+from .parallel import map_chunks
+from .pattern_cache import load_or_build, table_key
+from .patterns import is_word_char
+from .result_cache import ResultCache
+from .sentiment import polarity_terms
+
+# Joins reviews in a batch buffer; never part of a term, never a word character
+REVIEW_SEPARATOR = "\x01"
 
 
 class DecisionFactorAnalyzer:
     """Analyzes reviews for purchasing decision factors."""
 
     # Decision factor categories and their keywords
-    FACTORS = {
+    FACTORS: ClassVar[dict[str, dict[str, list[str]]]] = {
         "price_value": {
             "keywords": [
                 "price", "cost", "expensive", "cheap", "affordable", "value",
@@ -114,86 +125,228 @@ class DecisionFactorAnalyzer:
         },
     }
 
-    def __init__(self):
-        self._compile_patterns()
+    # Words that signal emphasis, counted once each toward importance
+    EMPHASIS_WORDS: ClassVar[list[str]] = [
+        "amazing", "incredible", "fantastic", "excellent", "best",
+        "worst", "terrible", "awful", "disappointing", "outstanding",
+    ]
 
-    def _compile_patterns(self):
-        """Compile regex patterns for efficiency."""
-        self.factor_patterns = {}
+    # Compiled patterns, built on first instantiation and shared by all instances
+    _patterns_compiled: ClassVar[bool] = False
+    factor_automaton: ClassVar[ahocorasick.Automaton]
+    emphasis_automaton: ClassVar[ahocorasick.Automaton]
 
-        for factor, config in self.FACTORS.items():
+    # Factors by review text and rating, shared by all instances
+    result_cache: ClassVar[ResultCache] = ResultCache()
+
+    def __init__(self):
+        if not type(self)._patterns_compiled:
+            type(self)._compile_patterns()
+
+    @classmethod
+    def _compile_patterns(cls):
+        """Load the factor and emphasis automata, building them on a cache miss."""
+        cls.factor_automaton = load_or_build(
+            "factor_automaton", table_key(cls.FACTORS), cls._build_factor_automaton
+        )
+        cls.emphasis_automaton = load_or_build(
+            "emphasis_automaton", table_key(cls.EMPHASIS_WORDS), cls._build_emphasis_automaton
+        )
+
+        cls._patterns_compiled = True
+
+    @classmethod
+    def _build_factor_automaton(cls) -> ahocorasick.Automaton:
+        """Build a single Aho-Corasick automaton over every factor term.
+
+        Each term maps to its length and (factor, priority) pairs, where
+        priority is the term's position in that factor's list, the order a
+        regex alternation would try it in.
+        """
+        automaton = ahocorasick.Automaton()
+
+        for factor, config in cls.FACTORS.items():
             keywords = config["keywords"]
             phrases = config.get("phrases", [])
 
-            # Combine keywords and phrases
-            all_terms = keywords + phrases
-            pattern = "|".join(re.escape(term) for term in all_terms)
-            self.factor_patterns[factor] = re.compile(
-                rf"\b({pattern})\b",
-                re.IGNORECASE
-            )
-
-    def analyze(self, review: Review) -> list[DecisionFactor]:
+            # Combine keywords and phrases; a term may belong to several factors
+            for priority, term in enumerate(keywords + phrases):
+                term = term.lower()
+                _, owners = automaton.get(term, (len(term), ()))
+                if all(owner != factor for owner, _ in owners):
+                    owners += ((factor, priority),)
+                automaton.add_word(term, (len(term), owners))
+
+        automaton.make_automaton()
+        return automaton
+
+    @classmethod
+    def _build_emphasis_automaton(cls) -> ahocorasick.Automaton:
+        """Emphasis words match as plain substrings, like the `in` check they replace."""
+        automaton = ahocorasick.Automaton()
+        for word in cls.EMPHASIS_WORDS:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return automaton
+
+    def _find_factor_matches(self, text_lower: str) -> dict[str, list[tuple[int, int]]]:
+        """Find whole-word factor term spans in one pass, grouped by factor."""
+        candidates: dict[str, list[tuple[int, int, int]]] = {}
+        text_len = len(text_lower)
+
+        for end_idx, (length, owners) in self.factor_automaton.iter(text_lower):
+            start = end_idx - length + 1
+            end = end_idx + 1
+            # Keep regex \b semantics: reject hits embedded in a larger word
+            if start > 0 and is_word_char(text_lower[start - 1]):
+                continue
+            if end < text_len and is_word_char(text_lower[end]):
+                continue
+            for factor_type, priority in owners:
+                candidates.setdefault(factor_type, []).append((start, priority, end))
+
+        # Mirror findall: leftmost, non-overlapping matches per factor, and
+        # at a shared start the term listed first, as the alternation tries it
+        hits: dict[str, list[tuple[int, int]]] = {}
+        for factor_type, spans in candidates.items():
+            spans.sort()
+            resolved = []
+            last_end = -1
+            for start, _, end in spans:
+                if start >= last_end:
+                    resolved.append((start, end))
+                    last_end = end
+            hits[factor_type] = resolved
+
+        return hits
+
+    def analyze(
+        self, review: Review, ctx: Optional[ReviewContext] = None
+    ) -> list[DecisionFactor]:
         """Analyze a review for decision factors."""
-        text = f"{review.title} {review.text}"
+        ctx = ctx or ReviewContext.from_review(review)
+
+        key = ResultCache.key(ctx.text, review.rating)
+        factors = self.result_cache.get(key)
+        if factors is None:
+            hits = self._find_factor_matches(ctx.text_lower)
+            factors = self._build_factors(review, ctx, hits)
+            self.result_cache.put(key, factors)
+
+        return [replace(factor, review_id=review.id or 0) for factor in factors]
+
+    def analyze_batch(self, reviews: list[Review]) -> list[list[DecisionFactor]]:
+        """Analyze many reviews with a single automaton sweep over all of them."""
+        all_contexts = [ReviewContext.from_review(review) for review in reviews]
+        keys = [
+            ResultCache.key(ctx.text, review.rating)
+            for review, ctx in zip(reviews, all_contexts)
+        ]
+        results: list[Optional[list[DecisionFactor]]] = [
+            self.result_cache.get(key) for key in keys
+        ]
+
+        # Only reviews without a cached result go through the sweep
+        pending = [i for i, factors in enumerate(results) if factors is None]
+        contexts = [all_contexts[i] for i in pending]
+
+        # One buffer, reviews separated by a non-word character so no term
+        # or word boundary crosses from one review into the next
+        buffer = REVIEW_SEPARATOR.join(ctx.text_lower for ctx in contexts)
+        review_starts = [0]
+        review_starts.extend(accumulate(
+            len(ctx.text_lower) + len(REVIEW_SEPARATOR) for ctx in contexts[:-1]
+        ))
+
+        # Demultiplex spans back to their review, relative to its own text
+        review_hits: list[dict[str, list[tuple[int, int]]]] = [{} for _ in contexts]
+        for factor_type, spans in self._find_factor_matches(buffer).items():
+            for start, end in spans:
+                idx = bisect_right(review_starts, start) - 1
+                offset = review_starts[idx]
+                review_hits[idx].setdefault(factor_type, []).append(
+                    (start - offset, end - offset)
+                )
+
+        for i, ctx, hits in zip(pending, contexts, review_hits):
+            factors = self._build_factors(reviews[i], ctx, hits)
+            self.result_cache.put(keys[i], factors)
+            results[i] = factors
+
+        return [
+            [replace(factor, review_id=review.id or 0) for factor in factors or []]
+            for review, factors in zip(reviews, results)
+        ]
+
+    def _build_factors(
+        self,
+        review: Review,
+        ctx: ReviewContext,
+        hits: dict[str, list[tuple[int, int]]],
+    ) -> list[DecisionFactor]:
+        """Turn factor term spans found in a review into DecisionFactors."""
+        text_lower = ctx.text_lower
+        if len(text_lower) != len(ctx.text):
+            # Lowercasing changed offsets (rare non-ASCII); slice the lowered text
+            ctx = ReviewContext(text_lower)
+        text = ctx.text
+
         factors = []
 
-        for factor_type, pattern in self.factor_patterns.items():
-            matches = pattern.findall(text)
+        # Per-sentence (polarity sum, assessed word count), scored at most once
+        sentence_sentiment: dict[int, tuple[float, int]] = {}
 
-            if matches:
-                # Extract sentences containing the factor
-                mentions = self._extract_factor_context(text, pattern)
+        # Sentence boundaries are computed once and shared by every factor
+        sentence_starts, sentence_ends = ctx.sentence_bounds
+
+        # Review-wide inputs to the importance score
+        emphasis_count = len({word for _, word in self.emphasis_automaton.iter(text_lower)})
 
-                # Analyze sentiment for this factor
-                sentiment_score = self._analyze_factor_sentiment(mentions)
+        for factor_type in self.FACTORS:
+            spans = hits.get(factor_type)
+
+            if spans:
+                matches = [text[start:end] for start, end in spans]
+
+                # Extract sentences containing the factor
+                sentence_indexes = sorted({
+                    bisect_right(sentence_starts, start) - 1 for start, _ in spans
+                })
+                mentions = []
+                polarity_total, assessed = 0.0, 0
+                for idx in sentence_indexes:
+                    cleaned = text[sentence_starts[idx]:sentence_ends[idx]].strip()
+                    if len(cleaned) > 10:
+                        mentions.append(cleaned)
+
+                        # Analyze sentiment, reusing scores of shared sentences
+                        if idx not in sentence_sentiment:
+                            sentence_sentiment[idx] = polarity_terms(cleaned)
+                        sentence_total, sentence_count = sentence_sentiment[idx]
+                        polarity_total += sentence_total
+                        assessed += sentence_count
+
+                sentiment_score = round(polarity_total / assessed, 3) if assessed else 0.0
 
                 # Calculate importance score based on frequency and emphasis
                 importance_score = self._calculate_importance(
-                    text, matches, review.rating
+                    matches, ctx.token_count, emphasis_count, review.rating
                 )
 
                 factors.append(DecisionFactor(
                     review_id=review.id or 0,
                     factor_type=factor_type,
-                    mentions=json.dumps(mentions[:10]),  # Limit to 10 mentions
+                    mentions=orjson.dumps(mentions[:10]).decode(),  # Limit to 10 mentions
                     sentiment_score=sentiment_score,
                     importance_score=importance_score,
                 ))
 
         return factors
 
-    def _extract_factor_context(self, text: str, pattern: re.Pattern) -> list[str]:
-        """Extract sentences containing the factor."""
-        sentences = re.split(r'[.!?]+', text)
-        relevant = []
-
-        for sentence in sentences:
-            if pattern.search(sentence):
-                cleaned = sentence.strip()
-                if cleaned and len(cleaned) > 10:
-                    relevant.append(cleaned)
-
-        return relevant
-
-    def _analyze_factor_sentiment(self, mentions: list[str]) -> float:
-        """Analyze sentiment of factor mentions."""
-        if not mentions:
-            return 0.0
-
-        try:
-            combined_text = " ".join(mentions)
-            blob = TextBlob(combined_text)
-            return round(blob.sentiment.polarity, 3)
-        except Exception:
-            return 0.0
-
     def _calculate_importance(
-        self, text: str, matches: list[str], rating: float
+        self, matches: list[str], word_count: int, emphasis_count: int, rating: float
     ) -> float:
         """Calculate importance score for a factor."""
-        word_count = len(text.split())
-
         # Frequency score (0-1)
         frequency = len(matches) / word_count if word_count > 0 else 0
         frequency_score = min(frequency * 50, 1.0)  # Cap at 1.0
@@ -202,12 +355,6 @@ class DecisionFactorAnalyzer:
         rating_score = (rating / 5.0) if rating else 0.5
 
         # Emphasis detection
-        emphasis_words = [
-            "amazing", "incredible", "fantastic", "excellent", "best",
-            "worst", "terrible", "awful", "disappointing", "outstanding",
-        ]
-        text_lower = text.lower()
-        emphasis_count = sum(1 for word in emphasis_words if word in text_lower)
         emphasis_score = min(emphasis_count * 0.2, 0.5)
 
         # Combine scores
@@ -222,8 +369,8 @@ class DecisionFactorAnalyzer:
             if factor.factor_type not in summary:
                 summary[factor.factor_type] = {
                     "count": 0,
-                    "total_importance": 0,
-                    "total_sentiment": 0,
+                    "total_importance": 0.0,
+                    "total_sentiment": 0.0,
                 }
 
             summary[factor.factor_type]["count"] += 1
@@ -236,19 +383,35 @@ class DecisionFactorAnalyzer:
                 stats["avg_importance"] = stats["total_importance"] / stats["count"]
                 stats["avg_sentiment"] = stats["total_sentiment"] / stats["count"]
             else:
-                stats["avg_importance"] = 0
-                stats["avg_sentiment"] = 0
+                stats["avg_importance"] = 0.0
+                stats["avg_sentiment"] = 0.0
 
         return summary
 
 
-def analyze_reviews(reviews: list[Review]) -> list[DecisionFactor]:
-    """Analyze a batch of reviews for decision factors."""
+def analyze_reviews(reviews: list[Review], workers: int = 1) -> list[DecisionFactor]:
+    """Analyze a batch of reviews for decision factors.
+
+    With workers > 1 the batch is split across that many processes.
+    """
+    if workers > 1:
+        return map_chunks(analyze_reviews, reviews, workers)
+
     analyzer = DecisionFactorAnalyzer()
-    all_factors = []
+    return list(chain.from_iterable(analyzer.analyze_batch(reviews)))
 
-    for review in reviews:
-        factors = analyzer.analyze(review)
-        all_factors.extend(factors)
 
-    return all_factors
+def iter_factors(
+    reviews: Iterable[Review], batch_size: int = 500
+) -> Iterator[DecisionFactor]:
+    """Yield decision factors as reviews are analyzed, one batch sweep at a time.
+
+    Lets a consumer such as a database writer start on the first factors
+    without holding every review's results in memory.
+    """
+    analyzer = DecisionFactorAnalyzer()
+    review_iter = iter(reviews)
+
+    while batch := list(islice(review_iter, batch_size)):
+        for factors in analyzer.analyze_batch(batch):
+            yield from factors
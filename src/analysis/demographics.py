@@ -1,15 +1,22 @@
 """Analyzer for demographic information from reviews."""
-import re
-from typing import Optional
+from dataclasses import replace
+from typing import Any, ClassVar, Optional
+
+import ahocorasick
 
 from ..database.models import Review, Demographic
+from .context import ReviewContext
+from .parallel import map_chunks
+from .pattern_cache import load_or_build, table_key
+from .patterns import compile_pattern, is_word_char
+from .result_cache import ResultCache
 
 
 class DemographicsAnalyzer:
     """Extracts demographic information from reviews and reviewer data."""
 
     # Region mapping based on countries
-    REGION_MAPPING = {
+    REGION_MAPPING: ClassVar[dict[str, list[str]]] = {
         # North America
         "NA": [
             "united states", "usa", "us", "america", "canada", "mexico",
@@ -39,8 +46,11 @@ class DemographicsAnalyzer:
         ],
     }
 
+    # Regions counted as target demographics
+    TARGET_REGIONS: ClassVar[frozenset[str]] = frozenset(("NA", "UK", "EU"))
+
     # Travel composition indicators
-    COMPOSITION_PATTERNS = {
+    COMPOSITION_PATTERNS: ClassVar[dict[str, list[str]]] = {
         "solo": [
             r"\bsolo\b", r"\balone\b", r"\bby myself\b", r"\bon my own\b",
             r"\bsingle traveler\b",
@@ -66,7 +76,7 @@ class DemographicsAnalyzer:
     }
 
     # Age/life stage indicators
-    AGE_PATTERNS = {
+    AGE_PATTERNS: ClassVar[dict[str, list[str]]] = {
         "retired": [
             r"\bretired\b", r"\bretirement\b", r"\bgolden years\b",
             r"\bsenior\b", r"\b(?:over |above )?(?:60|65|70)\b",
@@ -88,7 +98,7 @@ class DemographicsAnalyzer:
     }
 
     # Experience level patterns
-    EXPERIENCE_PATTERNS = {
+    EXPERIENCE_PATTERNS: ClassVar[dict[str, list[str]]] = {
         "first_safari": [
             r"\bfirst (?:time |ever )?safari\b", r"\bfirst safari\b",
             r"\bnever been (?:on )?(?:a )?safari\b", r"\bfirst time (?:in )?africa\b",
@@ -102,64 +112,123 @@ class DemographicsAnalyzer:
         ],
     }
 
+    # Compiled patterns, built on first instantiation and shared by all instances
+    _patterns_compiled: ClassVar[bool] = False
+    region_automaton: ClassVar[ahocorasick.Automaton]
+    composition_compiled: ClassVar[dict[str, Any]]
+    age_compiled: ClassVar[dict[str, Any]]
+    experience_compiled: ClassVar[dict[str, Any]]
+    party_size_pattern: ClassVar[Any]
+    solo_pattern: ClassVar[Any]
+    couple_pattern: ClassVar[Any]
+    from_patterns: ClassVar[list[Any]]
+
+    # Results by review text, location and trip type, shared by all instances
+    result_cache: ClassVar[ResultCache] = ResultCache()
+
     def __init__(self):
-        self._compile_patterns()
+        if not type(self)._patterns_compiled:
+            type(self)._compile_patterns()
 
-    def _compile_patterns(self):
+    @classmethod
+    def _compile_patterns(cls):
         """Compile regex patterns."""
+        cls.region_automaton = load_or_build(
+            "region_automaton", table_key(cls.REGION_MAPPING), cls._build_region_automaton
+        )
+
         # Compile composition patterns
-        self.composition_compiled = {}
-        for comp_type, patterns in self.COMPOSITION_PATTERNS.items():
+        cls.composition_compiled = {}
+        for comp_type, patterns in cls.COMPOSITION_PATTERNS.items():
             combined = "|".join(patterns)
-            self.composition_compiled[comp_type] = re.compile(
-                combined, re.IGNORECASE
-            )
+            cls.composition_compiled[comp_type] = compile_pattern(combined)
 
         # Compile age patterns
-        self.age_compiled = {}
-        for age_type, patterns in self.AGE_PATTERNS.items():
+        cls.age_compiled = {}
+        for age_type, patterns in cls.AGE_PATTERNS.items():
             combined = "|".join(patterns)
-            self.age_compiled[age_type] = re.compile(combined, re.IGNORECASE)
+            cls.age_compiled[age_type] = compile_pattern(combined)
 
         # Compile experience patterns
-        self.experience_compiled = {}
-        for exp_type, patterns in self.EXPERIENCE_PATTERNS.items():
+        cls.experience_compiled = {}
+        for exp_type, patterns in cls.EXPERIENCE_PATTERNS.items():
             combined = "|".join(patterns)
-            self.experience_compiled[exp_type] = re.compile(
-                combined, re.IGNORECASE
-            )
+            cls.experience_compiled[exp_type] = compile_pattern(combined)
 
         # Party size pattern
-        self.party_size_pattern = re.compile(
-            r"\b(?:group of |party of |(\d+) (?:of us|people)|\bwe were (\d+)\b)",
-            re.IGNORECASE
+        cls.party_size_pattern = compile_pattern(
+            r"\b(?:group of |party of |(\d+) (?:of us|people)|\bwe were (\d+)\b)"
         )
+        cls.solo_pattern = compile_pattern(r"\bsolo\b|\balone\b", ignore_case=False)
+        cls.couple_pattern = compile_pattern(r"\bcouple\b|\btwo of us\b", ignore_case=False)
+
+        # Patterns like "we're from", "visiting from", "came from" (run on lowercased text)
+        cls.from_patterns = [
+            compile_pattern(
+                r"(?:we're |we are |i'm |i am |visiting |came |coming |traveled? )?from ([A-Za-z\s,]+)",
+                ignore_case=False,
+            ),
+            compile_pattern(r"as (?:a |an )?([A-Za-z]+) tourist", ignore_case=False),
+        ]
+
+        cls._patterns_compiled = True
+
+    @classmethod
+    def _build_region_automaton(cls) -> ahocorasick.Automaton:
+        """Single automaton over every region indicator.
 
-    def analyze(self, review: Review) -> Demographic:
+        Values are (length, priority, region); priority is the region's
+        position in REGION_MAPPING and breaks ties between equal lengths.
+        """
+        automaton = ahocorasick.Automaton()
+        for priority, (region, indicators) in enumerate(cls.REGION_MAPPING.items()):
+            for indicator in indicators:
+                indicator = indicator.lower()
+                existing = automaton.get(indicator, None)
+                if existing is None or priority < existing[1]:
+                    automaton.add_word(indicator, (len(indicator), priority, region))
+        automaton.make_automaton()
+        return automaton
+
+    def analyze(
+        self, review: Review, ctx: Optional[ReviewContext] = None
+    ) -> Demographic:
         """Analyze a review for demographic information."""
-        text = f"{review.title} {review.text}"
+        ctx = ctx or ReviewContext.from_review(review)
+
+        key = ResultCache.key(ctx.text, review.reviewer_location, review.trip_type)
+        result = self.result_cache.get(key)
+        if result is None:
+            result = self._analyze_uncached(review, ctx)
+            self.result_cache.put(key, result)
 
+        return replace(result, review_id=review.id or 0)
+
+    def _analyze_uncached(self, review: Review, ctx: ReviewContext) -> Demographic:
+        """Extract demographics from the review fields the cache key covers."""
         # Determine region from reviewer location
         country, region = self._classify_region(review.reviewer_location)
 
         # If no location, try to infer from text
         if not region:
-            country, region = self._infer_region_from_text(text)
+            country, region = self._infer_region_from_text(ctx)
 
         # Determine travel composition
-        travel_composition = self._detect_composition(text, review.trip_type)
+        travel_composition = (
+            self._composition_from_trip_type(review.trip_type)
+            or self._detect_composition(ctx)
+        )
 
         # Estimate party size
-        party_size = self._extract_party_size(text)
+        party_size = self._extract_party_size(ctx)
 
         # Determine experience level
-        experience_level = self._detect_experience(text)
+        experience_level = self._detect_experience(ctx.text)
 
         # Detect age/life stage indicators
-        age_indicator = self._detect_age_indicator(text)
+        age_indicator = self._detect_age_indicator(ctx.text)
 
         return Demographic(
-            review_id=review.id or 0,
             country=country,
             region=region,
             travel_composition=travel_composition,
@@ -174,36 +243,37 @@ class DemographicsAnalyzer:
             return "", ""
 
         location_lower = location.lower()
-
-        # Check each region
-        for region, indicators in self.REGION_MAPPING.items():
-            for indicator in indicators:
-                if indicator in location_lower:
-                    return location, region
+        best = None
+
+        # Longest whole-word indicator wins, so "us" no longer matches inside
+        # "russia" and "new york" outranks "york"
+        for end_idx, (length, priority, region) in self.region_automaton.iter(location_lower):
+            start = end_idx - length + 1
+            end = end_idx + 1
+            if start > 0 and is_word_char(location_lower[start - 1]):
+                continue
+            if end < len(location_lower) and is_word_char(location_lower[end]):
+                continue
+            if best is None or (length, -priority) > (best[0], -best[1]):
+                best = (length, priority, region)
+
+        if best is not None:
+            return location, best[2]
 
         return location, "Other"
 
-    def _infer_region_from_text(self, text: str) -> tuple[str, str]:
+    def _infer_region_from_text(self, ctx: ReviewContext) -> tuple[str, str]:
         """Try to infer region from review text."""
-        text_lower = text.lower()
-
-        # Look for patterns like "we're from", "visiting from", "came from"
-        from_patterns = [
-            r"(?:we're |we are |i'm |i am |visiting |came |coming |traveled? )?from ([A-Za-z\s,]+)",
-            r"as (?:a |an )?([A-Za-z]+) tourist",
-        ]
-
-        for pattern in from_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in self.from_patterns:
+            match = pattern.search(ctx.text_lower)
             if match:
                 potential_location = match.group(1).strip()
                 return self._classify_region(potential_location)
 
         return "", ""
 
-    def _detect_composition(self, text: str, trip_type: str) -> str:
-        """Detect travel composition from text and trip type."""
-        # First check explicit trip type from scraper
+    def _composition_from_trip_type(self, trip_type: str) -> str:
+        """Map the scraper's explicit trip type to a composition, if it names one."""
         if trip_type:
             trip_lower = trip_type.lower()
             if "solo" in trip_lower:
@@ -217,23 +287,25 @@ class DemographicsAnalyzer:
             elif "group" in trip_lower:
                 return "group"
 
-        # Detect from text
-        text_lower = text.lower()
-        composition_scores = {}
+        return ""
+
+    def _detect_composition(self, ctx: ReviewContext) -> str:
+        """Detect travel composition from text, for reviews whose trip type names none."""
+        composition_scores: dict[str, int] = {}
 
         for comp_type, pattern in self.composition_compiled.items():
-            matches = pattern.findall(text_lower)
+            matches = pattern.findall(ctx.text_lower)
             if matches:
                 composition_scores[comp_type] = len(matches)
 
         if composition_scores:
-            return max(composition_scores, key=composition_scores.get)
+            return max(composition_scores, key=composition_scores.__getitem__)
 
         return ""
 
-    def _extract_party_size(self, text: str) -> Optional[int]:
+    def _extract_party_size(self, ctx: ReviewContext) -> Optional[int]:
         """Extract party size from text."""
-        matches = self.party_size_pattern.findall(text)
+        matches = self.party_size_pattern.findall(ctx.text)
 
         for match in matches:
             for group in match:
@@ -243,10 +315,9 @@ class DemographicsAnalyzer:
                         return size
 
         # Infer from composition
-        text_lower = text.lower()
-        if re.search(r"\bsolo\b|\balone\b", text_lower):
+        if self.solo_pattern.search(ctx.text_lower):
             return 1
-        elif re.search(r"\bcouple\b|\btwo of us\b", text_lower):
+        elif self.couple_pattern.search(ctx.text_lower):
             return 2
 
         return None
@@ -269,10 +340,16 @@ class DemographicsAnalyzer:
 
     def is_target_demographic(self, demographic: Demographic) -> bool:
         """Check if demographic matches target (NA/UK/EU)."""
-        return demographic.region in ["NA", "UK", "EU"]
+        return demographic.region in self.TARGET_REGIONS
+
+
+def analyze_reviews(reviews: list[Review], workers: int = 1) -> list[Demographic]:
+    """Analyze a batch of reviews for demographics.
 
+    With workers > 1 the batch is split across that many processes.
+    """
+    if workers > 1:
+        return map_chunks(analyze_reviews, reviews, workers)
 
-def analyze_reviews(reviews: list[Review]) -> list[Demographic]:
-    """Analyze a batch of reviews for demographics."""
     analyzer = DemographicsAnalyzer()
     return [analyzer.analyze(review) for review in reviews]
@@ -1,18 +1,25 @@
 """Analyzer for safari guide mentions in reviews."""
-import re
-import json
-from typing import Optional
+from bisect import bisect_left, bisect_right
+from dataclasses import replace
+from typing import Any, ClassVar, Optional
 
-from textblob import TextBlob
+import ahocorasick
+import orjson
 
 from ..database.models import Review, GuideAnalysis
+from .context import ReviewContext
+from .parallel import map_chunks
+from .pattern_cache import load_or_build, table_key
+from .patterns import compile_pattern, is_word_char, trie_alternation
+from .result_cache import ResultCache
+from .sentiment import polarity
 
 
 class GuideAnalyzer:
     """Analyzes reviews for safari guide mentions and sentiment."""
 
     # Keywords that indicate a guide mention
-    GUIDE_KEYWORDS = [
+    GUIDE_KEYWORDS: ClassVar[list[str]] = [
         "guide",
         "driver",
         "ranger",
@@ -27,7 +34,7 @@ class GuideAnalyzer:
     ]
 
     # Common safari guide names (can be expanded)
-    COMMON_GUIDE_NAMES = [
+    COMMON_GUIDE_NAMES: ClassVar[list[str]] = [
         # East African names
         "Joseph", "David", "Peter", "John", "James", "Michael", "Moses",
         "Daniel", "Samuel", "Simon", "Patrick", "Francis", "George",
@@ -37,142 +44,240 @@ class GuideAnalyzer:
         "Pieter", "Johan", "Willem", "Jan", "Thabo", "Sipho",
     ]
 
+    # A known name counts when one of these keywords is within the window
+    NAME_CONTEXT_KEYWORDS: ClassVar[frozenset[str]] = frozenset(("guide", "driver", "ranger"))
+    NAME_CONTEXT_WINDOW: ClassVar[int] = 30
+
+    # Compiled patterns, built on first instantiation and shared by all instances
+    _patterns_compiled: ClassVar[bool] = False
+    keyword_regex: ClassVar[Any]
+    guide_name_patterns: ClassVar[list[Any]]
+    known_name_automaton: ClassVar[ahocorasick.Automaton]
+    emphasis_patterns: ClassVar[list[Any]]
+
+    # Results by review text, shared by all instances
+    result_cache: ClassVar[ResultCache] = ResultCache()
+
     def __init__(self):
-        self._compile_patterns()
+        if not type(self)._patterns_compiled:
+            type(self)._compile_patterns()
 
-    def _compile_patterns(self):
+    @classmethod
+    def _compile_patterns(cls):
         """Compile regex patterns for efficiency."""
         # Pattern for guide keywords
-        keywords_pattern = "|".join(self.GUIDE_KEYWORDS)
-        self.keyword_regex = re.compile(
-            rf"\b({keywords_pattern})\b",
-            re.IGNORECASE
-        )
+        keywords_pattern = trie_alternation(cls.GUIDE_KEYWORDS)
+        cls.keyword_regex = compile_pattern(rf"\b({keywords_pattern})\b")
 
         # Pattern for "our [keyword] [Name]" or "[Name] was our [keyword]"
-        self.guide_name_patterns = [
-            re.compile(
+        cls.guide_name_patterns = [
+            compile_pattern(
                 rf"\b(?:our|the|my)\s+(?:{keywords_pattern})[,\s]+([A-Z][a-z]+)\b",
-                re.IGNORECASE
             ),
-            re.compile(
+            compile_pattern(
                 rf"\b([A-Z][a-z]+)\s+(?:was|is)\s+(?:our|the|my|a|an)\s+(?:{keywords_pattern})\b",
-                re.IGNORECASE
             ),
-            re.compile(
+            compile_pattern(
                 rf"\b(?:{keywords_pattern})\s+(?:named|called)\s+([A-Z][a-z]+)\b",
-                re.IGNORECASE
             ),
         ]
 
-    def analyze(self, review: Review) -> GuideAnalysis:
+        # Single automaton over the known names, matched on lowercased text
+        cls.known_name_automaton = load_or_build(
+            "known_name_automaton",
+            table_key(cls.COMMON_GUIDE_NAMES),
+            cls._build_known_name_automaton,
+        )
+
+        # Emphasis patterns for guide importance
+        cls.emphasis_patterns = [
+            compile_pattern(pattern) for pattern in (
+                r"\b(?:amazing|incredible|fantastic|best|excellent|wonderful|outstanding)\s+(?:guide|driver)\b",
+                r"\b(?:guide|driver)\s+(?:was|is)\s+(?:amazing|incredible|fantastic|best|excellent)\b",
+                r"\b(?:thanks|thank you|grateful)\b.{0,50}\b(?:guide|driver)\b",
+                r"\bmade\s+(?:the|our)\s+(?:trip|safari|experience).{0,30}\b(?:guide|driver)\b",
+                r"\b(?:guide|driver)\b.{0,30}\bmade\s+(?:the|our)\s+(?:trip|safari|experience)\b",
+            )
+        ]
+
+        cls._patterns_compiled = True
+
+    @classmethod
+    def _build_known_name_automaton(cls) -> ahocorasick.Automaton:
+        """Map each lowercased known name back to its listed spelling."""
+        automaton = ahocorasick.Automaton()
+        for name in cls.COMMON_GUIDE_NAMES:
+            automaton.add_word(name.lower(), name)
+        automaton.make_automaton()
+        return automaton
+
+    def analyze(
+        self, review: Review, ctx: Optional[ReviewContext] = None
+    ) -> GuideAnalysis:
         """Analyze a review for guide mentions."""
-        text = f"{review.title} {review.text}"
+        ctx = ctx or ReviewContext.from_review(review)
+
+        key = ResultCache.key(ctx.text)
+        result = self.result_cache.get(key)
+        if result is None:
+            result = self._analyze_text(ctx)
+            self.result_cache.put(key, result)
+
+        return replace(result, review_id=review.id or 0)
+
+    def _analyze_text(self, ctx: ReviewContext) -> GuideAnalysis:
+        """Analyze review text for guide mentions, without a review id."""
+        text = ctx.text
 
         # Find keyword mentions
-        keyword_matches = self.keyword_regex.findall(text)
-        keywords_found = list(set(k.lower() for k in keyword_matches))
+        keyword_spans = self._find_keyword_spans(text)
+        keywords_found = list(dict.fromkeys(keyword for _, _, keyword in keyword_spans))
 
         # Extract guide names
-        guide_names = self._extract_guide_names(text)
+        guide_names = self._extract_guide_names(ctx, keyword_spans)
 
         # Check if guide is mentioned
-        mentions_guide = len(keyword_matches) > 0
+        mentions_guide = len(keyword_spans) > 0
 
         # Extract sentences mentioning guides for context
-        guide_context = self._extract_guide_context(text)
+        guide_context = self._extract_guide_context(ctx, keyword_spans)
 
         # Analyze sentiment around guide mentions
         sentiment_score, sentiment_label = self._analyze_guide_sentiment(guide_context)
 
         return GuideAnalysis(
-            review_id=review.id or 0,
             mentions_guide=mentions_guide,
-            guide_names=json.dumps(guide_names),
-            guide_keywords_found=json.dumps(keywords_found),
+            guide_names=orjson.dumps(guide_names).decode(),
+            guide_keywords_found=orjson.dumps(keywords_found).decode(),
             sentiment_score=sentiment_score,
             sentiment_label=sentiment_label,
             guide_context=guide_context[:2000],  # Limit context length
         )
 
-    def _extract_guide_names(self, text: str) -> list[str]:
-        """Extract guide names from text."""
-        names = []
+    def _find_keyword_spans(self, text: str) -> list[tuple[int, int, str]]:
+        """Find guide keywords as (start, end, lowercased keyword)."""
+        return [
+            (match.start(), match.end(), match.group(1).lower())
+            for match in self.keyword_regex.finditer(text)
+        ]
+
+    def _extract_guide_names(
+        self, ctx: ReviewContext, keyword_spans: list[tuple[int, int, str]]
+    ) -> list[str]:
+        """Extract guide names from text, without duplicates."""
+        names: dict[str, None] = {}  # Ordered set
 
         # Use patterns to find names
         for pattern in self.guide_name_patterns:
-            matches = pattern.findall(text)
+            matches = pattern.findall(ctx.text)
             for match in matches:
                 name = match.strip()
                 if name and len(name) > 1:
-                    names.append(name)
+                    names[name] = None
 
         # Also check for known names in guide context
-        for name in self.COMMON_GUIDE_NAMES:
-            # Look for name near guide keywords
-            pattern = re.compile(
-                rf"\b{name}\b.{{0,30}}\b(?:guide|driver|ranger)\b|\b(?:guide|driver|ranger)\b.{{0,30}}\b{name}\b",
-                re.IGNORECASE
-            )
-            if pattern.search(text):
-                if name not in names:
-                    names.append(name)
+        text = ctx.text_lower
+        if len(text) != len(ctx.text):
+            # Lowercasing changed offsets (rare non-ASCII); rescan the lowered text
+            keyword_spans = self._find_keyword_spans(text)
+        anchor_starts = []
+        anchor_ends = []
+        for start, end, keyword in keyword_spans:
+            if keyword in self.NAME_CONTEXT_KEYWORDS:
+                anchor_starts.append(start)
+                anchor_ends.append(end)
+
+        found = set()
+        if anchor_starts:
+            for end_idx, name in self.known_name_automaton.iter(text):
+                start = end_idx - len(name) + 1
+                end = end_idx + 1
+                if name in found:
+                    continue
+                # Whole words only, as with \b around the name
+                if start > 0 and is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and is_word_char(text[end]):
+                    continue
+                if self._near_guide_keyword(text, start, end, anchor_starts, anchor_ends):
+                    found.add(name)
 
-        return list(set(names))
-
-    def _extract_guide_context(self, text: str) -> str:
+        for name in self.COMMON_GUIDE_NAMES:
+            if name in found:
+                names[name] = None
+
+        return list(names)
+
+    def _near_guide_keyword(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        anchor_starts: list[int],
+        anchor_ends: list[int],
+    ) -> bool:
+        """Check for a keyword within the window of a name, on the same line."""
+        window = self.NAME_CONTEXT_WINDOW
+
+        # Nearest keyword after the name
+        idx = bisect_left(anchor_starts, end)
+        if idx < len(anchor_starts):
+            gap_end = anchor_starts[idx]
+            if gap_end - end <= window and "\n" not in text[end:gap_end]:
+                return True
+
+        # Nearest keyword before the name
+        idx = bisect_right(anchor_ends, start) - 1
+        if idx >= 0:
+            gap_start = anchor_ends[idx]
+            if start - gap_start <= window and "\n" not in text[gap_start:start]:
+                return True
+
+        return False
+
+    def _extract_guide_context(
+        self, ctx: ReviewContext, keyword_spans: list[tuple[int, int, str]]
+    ) -> str:
         """Extract sentences that mention guides."""
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        guide_sentences = []
-
-        for sentence in sentences:
-            if self.keyword_regex.search(sentence):
-                guide_sentences.append(sentence.strip())
+        # Keywords never contain a delimiter, so each lies in one sentence
+        sentence_starts, _ = ctx.sentence_bounds
+        sentence_indexes = sorted({
+            bisect_right(sentence_starts, start) - 1 for start, _, _ in keyword_spans
+        })
 
-        return " ".join(guide_sentences)
+        return " ".join(ctx.sentences[idx].strip() for idx in sentence_indexes)
 
     def _analyze_guide_sentiment(self, context: str) -> tuple[float, str]:
         """Analyze sentiment of guide-related text."""
         if not context:
             return 0.0, "neutral"
 
-        try:
-            blob = TextBlob(context)
-            polarity = blob.sentiment.polarity  # -1 to 1
+        score = polarity(context)  # -1 to 1
 
-            if polarity > 0.1:
-                label = "positive"
-            elif polarity < -0.1:
-                label = "negative"
-            else:
-                label = "neutral"
+        if score > 0.1:
+            label = "positive"
+        elif score < -0.1:
+            label = "negative"
+        else:
+            label = "neutral"
 
-            return round(polarity, 3), label
+        return round(score, 3), label
 
-        except Exception:
-            return 0.0, "neutral"
-
-    def get_guide_importance_indicators(self, review: Review) -> dict:
+    def get_guide_importance_indicators(
+        self, review: Review, ctx: Optional[ReviewContext] = None
+    ) -> dict:
         """Get indicators of how important the guide was in the review."""
-        text = f"{review.title} {review.text}".lower()
-        word_count = len(text.split())
+        ctx = ctx or ReviewContext.from_review(review)
+        text = ctx.text_lower
+        word_count = ctx.token_count
 
         # Count guide-related words
         guide_word_count = len(self.keyword_regex.findall(text))
 
         # Check for emphasis patterns
-        emphasis_patterns = [
-            r"\b(?:amazing|incredible|fantastic|best|excellent|wonderful|outstanding)\s+(?:guide|driver)\b",
-            r"\b(?:guide|driver)\s+(?:was|is)\s+(?:amazing|incredible|fantastic|best|excellent)\b",
-            r"\b(?:thanks|thank you|grateful)\b.{0,50}\b(?:guide|driver)\b",
-            r"\bmade\s+(?:the|our)\s+(?:trip|safari|experience).{0,30}\b(?:guide|driver)\b",
-            r"\b(?:guide|driver)\b.{0,30}\bmade\s+(?:the|our)\s+(?:trip|safari|experience)\b",
-        ]
-
         emphasis_count = sum(
-            1 for pattern in emphasis_patterns
-            if re.search(pattern, text, re.IGNORECASE)
+            1 for pattern in self.emphasis_patterns
+            if pattern.search(text)
         )
 
         return {
@@ -184,7 +289,13 @@ class GuideAnalyzer:
         }
 
 
-def analyze_reviews(reviews: list[Review]) -> list[GuideAnalysis]:
-    """Analyze a batch of reviews."""
+def analyze_reviews(reviews: list[Review], workers: int = 1) -> list[GuideAnalysis]:
+    """Analyze a batch of reviews.
+
+    With workers > 1 the batch is split across that many processes.
+    """
+    if workers > 1:
+        return map_chunks(analyze_reviews, reviews, workers)
+
     analyzer = GuideAnalyzer()
     return [analyzer.analyze(review) for review in reviews]
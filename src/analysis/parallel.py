@@ -0,0 +1,38 @@
+"""Process-pool fan-out for batch analysis."""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def split_chunks(items: list[T], count: int) -> list[list[T]]:
+    """Split items into at most count contiguous, near-equal chunks."""
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def map_chunks(
+    func: Callable[[list[T]], list[R]], items: list[T], workers: int
+) -> list[R]:
+    """Run func over chunks of items in worker processes, keeping order.
+
+    func must be a module-level function so it can be pickled; each worker
+    builds its own analyzer, compiling patterns once per process.
+    """
+    chunks = split_chunks(items, workers)
+    if len(chunks) <= 1:
+        return func(items)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        for chunk_result in executor.map(func, chunks):
+            results.extend(chunk_result)
+    return results
@@ -0,0 +1,83 @@
+"""On-disk cache for the analyzers' compiled tables.
+
+Aho-Corasick automata and the flattened sentiment lexicon are pickled to
+_patterns.pkl next to this module, each entry keyed by a hash of the
+tables it was built from, so a changed keyword list rebuilds on its own.
+Loading the lexicon from here also avoids importing TextBlob at startup.
+Run `python -m src.analysis.build_patterns` to prebuild the file.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+CACHE_PATH = Path(__file__).with_name("_patterns.pkl")
+
+# Bump when the layout of cached values changes
+CACHE_VERSION = 3
+
+_cache: Optional[dict[str, tuple[str, Any]]] = None
+
+
+def table_key(*tables: Any) -> str:
+    """Hash the source tables an entry is built from."""
+    return hashlib.blake2b(
+        repr((CACHE_VERSION, tables)).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _load_cache() -> dict[str, tuple[str, Any]]:
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_PATH, "rb") as f:
+                _cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache: dict[str, tuple[str, Any]]) -> None:
+    """Write the cache atomically; a read-only install just skips it."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_PATH.parent, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def load_or_build(name: str, key: str, build: Callable[[], T]) -> T:
+    """Return the cached value for name if its key matches, else build and store it."""
+    cache = _load_cache()
+    entry = cache.get(name)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+
+    value = build()
+    cache[name] = (key, value)
+    _save_cache(cache)
+    return value
+
+
+def clear_cache() -> None:
+    """Remove the cache file and forget loaded entries."""
+    global _cache
+    _cache = {}
+    try:
+        CACHE_PATH.unlink()
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,72 @@
+"""Regex compilation shared by the analyzers.
+
+Patterns are compiled with RE2 when google-re2 is installed, which gives
+linear-time matching on the large keyword alternations the analyzers
+build. RE2 exposes the same search/findall/finditer surface used here,
+so callers work unchanged with the stdlib fallback.
+"""
+import re
+from typing import Iterable
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def compile_pattern(pattern: str, ignore_case: bool = True):
+    """Compile a pattern with RE2 if available, otherwise with the re module."""
+    if ignore_case:
+        # Inline flag works for both engines (RE2 takes no re.* flags)
+        pattern = f"(?i){pattern}"
+
+    if RE2_AVAILABLE:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+
+def trie_alternation(words: Iterable[str]) -> str:
+    """Build a non-capturing alternation over literal words with shared prefixes factored out.
+
+    ["guide", "guides", "ranger"] becomes "(?:guide(?:s)?|ranger)", so a
+    backtracking engine tests each shared prefix once. Equivalent to a
+    plain alternation wherever the group is followed by \\b.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End of word
+
+    return f"(?:{'|'.join(_trie_branches(trie))})"
+
+
+def _trie_branches(node: dict) -> list[str]:
+    return [
+        re.escape(char) + _trie_group(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+
+
+def _trie_group(node: dict) -> str:
+    branches = _trie_branches(node)
+    if not branches:
+        return ""
+
+    optional = "" in node
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    return f"(?:{'|'.join(branches)})" + ("?" if optional else "")
+
+
+def is_re2_available() -> bool:
+    """Check if the RE2 engine is available."""
+    return RE2_AVAILABLE
+
+
+def is_word_char(char: str) -> bool:
+    """Match the regex definition of a word character used by \\b."""
+    return char.isalnum() or char == "_"
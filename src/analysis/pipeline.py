@@ -0,0 +1,58 @@
+"""Runs all three analyzers over reviews read straight from the database."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator
+
+from ..database.connection import read_reviews
+from ..database.models import Review, GuideAnalysis, DecisionFactor, Demographic
+from .context import ReviewContext
+from .decision_factors import DecisionFactorAnalyzer
+from .demographics import DemographicsAnalyzer
+from .guide_analyzer import GuideAnalyzer
+
+AnalysisResults = tuple[list[GuideAnalysis], list[DecisionFactor], list[Demographic]]
+
+# More processes than this mostly contend on the single database writer
+MAX_WORKERS = 8
+
+
+def default_workers() -> int:
+    """Worker processes to use for the analyze command."""
+    return min(os.cpu_count() or 1, MAX_WORKERS)
+
+
+def analyze_all(reviews: Iterable[Review]) -> AnalysisResults:
+    """Run the guide, decision factor and demographics analyzers over reviews."""
+    guide_analyzer = GuideAnalyzer()
+    factor_analyzer = DecisionFactorAnalyzer()
+    demo_analyzer = DemographicsAnalyzer()
+
+    guide_results = []
+    factor_results = []
+    demo_results = []
+    for review in reviews:
+        # Lowercased text, tokens and sentences shared by all analyzers
+        ctx = ReviewContext.from_review(review)
+        guide_results.append(guide_analyzer.analyze(review, ctx))
+        factor_results.extend(factor_analyzer.analyze(review, ctx))
+        demo_results.append(demo_analyzer.analyze(review, ctx))
+
+    return guide_results, factor_results, demo_results
+
+
+def analyze_review_ids(db_path: str, review_ids: list[int]) -> AnalysisResults:
+    """Worker entry point: read reviews read-only and analyze them."""
+    return analyze_all(read_reviews(db_path, review_ids))
+
+
+def iter_analysis_results(
+    db_path: str, id_chunks: Iterable[list[int]], workers: int
+) -> Iterator[AnalysisResults]:
+    """Analyze chunks of review IDs in worker processes, yielding results in chunk order.
+
+    Workers open their own read-only connections, so the caller stays the
+    only writer.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(partial(analyze_review_ids, db_path), id_chunks)
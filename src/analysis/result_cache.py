@@ -0,0 +1,41 @@
+"""Bounded in-memory cache of analyzer results keyed by review content."""
+import hashlib
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class ResultCache:
+    """LRU cache mapping a digest of an analyzer's inputs to its result.
+
+    Keys hash only the fields an analyzer reads, so re-analyzing an
+    unchanged review (re-runs, duplicates across sources) skips all
+    pattern and sentiment work. Callers store review-independent results
+    and stamp the review id on the copy they return.
+    """
+
+    def __init__(self, maxsize: int = 50_000):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+
+    @staticmethod
+    def key(*parts: object) -> bytes:
+        """Digest the analyzer inputs that determine a result."""
+        return hashlib.blake2b(repr(parts).encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,169 @@
+"""Lexicon-based polarity scoring shared by the analyzers.
+
+Scores follow TextBlob's pattern analyzer - same lexicon, negation,
+modifier, exclamation, emoticon and sarcasm rules - but run as plain dict
+lookups. Most text is split with a regex, skipping TextBlob's tokenizer
+and per-token emoticon scan. Text the regex can't split the same way -
+anything that may hold an emoticon or "(!)", or punctuation between two
+words, which TextBlob keeps inside one token - goes through TextBlob's
+tokenizer instead.
+"""
+import re
+from functools import lru_cache
+from importlib.metadata import version
+
+from .pattern_cache import load_or_build, table_key
+
+# Same negations and modifier heuristic as textblob.en.sentiment
+NEGATIONS = frozenset(("no", "not", "n't", "never"))
+
+# Words, exclamation marks and ellipses, splitting contractions the way
+# TextBlob's tokenizer does ("didn't" -> "did", "n", "t"). Other single
+# punctuation marks never affect the score, so they are not emitted.
+TOKEN_PATTERN = re.compile(r"\w+(?=n't)|[\w-]+|!|\.\.\.")
+
+# Emoticon characters rare in plain prose; an emoticon made only of common
+# ones ("x-d", "o.o") is matched whole instead
+EMOTICON_MARK_CHARS = frozenset(":;=<>*()[]{}°/\\^'")
+
+# TextBlob scores "(!)" as a neutral assessment, diluting the average
+SARCASM_TOKEN = "(!)"
+
+# Text TOKEN_PATTERN would split differently from TextBlob: punctuation
+# between two words ("trip!very", "3.5") or periods leading a word
+# ("...nice"), which TextBlob keeps in one token; a hyphen or underscore at
+# a word's edge, which TextBlob splits off; symbols TextBlob doesn't treat
+# as punctuation ("100%"); and "n't" in any case but lower, which its
+# contraction rule misses ("DON'T")
+TOKENIZER_MISMATCH_PATTERNS = (
+    r"\w[^\w\s'-]+\w",
+    r"(?<!\w)\.+\w",
+    r"(?-i:N'[tT]|n'T)",
+    r"\w-(?!\w)|(?<!\w)-\w",
+    r"_",
+    r"[^\w\s.,;:!?()\[\]{}`'\"@#$^&*+|=~-]",
+)
+
+
+@lru_cache(maxsize=1)
+def load_lexicon() -> dict[str, tuple[float, float, bool]]:
+    """Load the flat word -> (polarity, intensity, is_modifier) table once."""
+    # Keyed on the TextBlob release the lexicon ships with
+    return load_or_build(
+        "sentiment_lexicon", table_key("textblob", version("textblob")), _build_lexicon
+    )
+
+
+@lru_cache(maxsize=1)
+def load_emoticons() -> tuple[dict[str, float], re.Pattern]:
+    """Load the emoticon -> polarity table and the pattern flagging text to tokenize with TextBlob.
+
+    The pattern is case-insensitive and searched on the original text.
+    """
+    return load_or_build(
+        "sentiment_emoticons",
+        table_key(
+            "textblob", version("textblob"),
+            sorted(EMOTICON_MARK_CHARS), TOKENIZER_MISMATCH_PATTERNS,
+        ),
+        _build_emoticons,
+    )
+
+
+def _build_emoticons() -> tuple[dict[str, float], re.Pattern]:
+    """Collect the emoticons TextBlob scores, keyed the way it compares tokens."""
+    from textblob._text import EMOTICONS, PUNCTUATION
+
+    emoticons = {
+        emoticon.lower(): polarity
+        for (_, polarity), group in EMOTICONS.items()
+        for emoticon in group
+        # TextBlob only tries tokens that pass this check
+        if not emoticon.isalpha() and len(emoticon) <= 5 and emoticon not in PUNCTUATION
+    }
+
+    marks = set()
+    for emoticon in list(emoticons) + [SARCASM_TOKEN]:
+        rare = [char for char in emoticon if char in EMOTICON_MARK_CHARS]
+        marks.add(re.escape(rare[0] if rare else emoticon))
+    return emoticons, re.compile(
+        "|".join(sorted(marks) + list(TOKENIZER_MISMATCH_PATTERNS)), re.IGNORECASE
+    )
+
+
+def _textblob_tokens(text: str) -> list[str]:
+    """Lowercased tokens as TextBlob's pattern analyzer sees them."""
+    from textblob._text import find_tokens
+
+    return " ".join(find_tokens(text)).lower().split()
+
+
+def _build_lexicon() -> dict[str, tuple[float, float, bool]]:
+    """Flatten TextBlob's pattern lexicon; imported here as it is slow to load."""
+    from textblob.en import sentiment as pattern_sentiment
+
+    return {
+        word: (scores[None][0], scores[None][2], "RB" in scores)
+        for word, scores in pattern_sentiment.items()
+    }
+
+
+def polarity_terms(text: str) -> tuple[float, int]:
+    """Return the summed polarity of assessed words and how many were assessed."""
+    lexicon = load_lexicon()
+    emoticons, textblob_only = load_emoticons()
+    if textblob_only.search(text):
+        words = _textblob_tokens(text)
+    else:
+        words = TOKEN_PATTERN.findall(text.lower())
+
+    assessments = []  # [polarity, intensity, negated]
+    modifier = None  # Preceding modifier word ("very good")
+    negation = None  # Preceding negation ("not good")
+
+    for word in words:
+        entry = lexicon.get(word)
+        if entry is not None:
+            polarity, intensity, is_modifier = entry
+            if modifier is None:
+                assessments.append([polarity, intensity, False])
+            else:
+                previous = assessments[-1]
+                previous[0] = max(-1.0, min(polarity * previous[1], 1.0))
+                previous[1] = intensity
+            if negation is not None:
+                assessments[-1][1] = 1.0 / assessments[-1][1]
+                assessments[-1][2] = True
+            modifier = word if is_modifier else None
+            negation = word if word in NEGATIONS else None
+        else:
+            if word in NEGATIONS:
+                negation = word
+            elif negation and len(word.strip("'")) > 1:
+                # Retain negation across small words ("not a good")
+                negation = None
+            if negation is not None and modifier is not None and modifier.endswith("ly"):
+                # "really not good"
+                assessments[-1][2] = True
+                negation = None
+            elif modifier and len(word) > 2:
+                modifier = None
+            if word == "!" and assessments:
+                # Exclamation marks boost the previous word
+                assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+            if word == SARCASM_TOKEN:
+                assessments.append([0.0, 1.0, False])
+            elif word in emoticons:
+                assessments.append([emoticons[word], 1.0, False])
+
+    total = sum(
+        polarity * -0.5 if negated else polarity
+        for polarity, _, negated in assessments
+    )
+    return total, len(assessments)
+
+
+def polarity(text: str) -> float:
+    """Polarity of text between -1 and 1, matching TextBlob's scale."""
+    total, count = polarity_terms(text)
+    return total / count if count else 0.0
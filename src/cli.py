@@ -10,11 +10,25 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 
 from .database import Database
-from .scrapers import SafaribookingsScraper, TripAdvisorScraper
+from .scrapers import AdaptiveLimiter, SafaribookingsScraper, TripAdvisorScraper
 from .analysis import GuideAnalyzer, DecisionFactorAnalyzer, DemographicsAnalyzer
+from .analysis.context import ReviewContext
+from .analysis.pipeline import default_workers, iter_analysis_results
 
 console = Console()
 
+# Reviews analyzed between database writes
+ANALYZE_FLUSH_SIZE = 5000
+
+# Reviews handed to each analysis worker task
+ANALYZE_CHUNK_SIZE = 500
+
+# Reviews per progress bar update during analysis
+PROGRESS_TICK = 100
+
+# Scraped reviews buffered before each database write
+SCRAPE_WRITE_BATCH_SIZE = 1000
+
 
 @click.group()
 @click.option("--db", default="data/reviews.db", help="Database path")
@@ -31,108 +45,186 @@ def main(ctx, db):
 @click.option("--max-reviews", default=50, help="Maximum reviews per operator")
 @click.option("--headless/--no-headless", default=True, help="Run browser headless")
 @click.option("--resume/--no-resume", default=True, help="Resume from last position")
+@click.option("--concurrent", is_flag=True,
+              help="Scrape Safaribookings operators in parallel under an adaptive limit")
 @click.pass_context
-def scrape(ctx, source, max_operators, max_reviews, headless, resume):
+def scrape(ctx, source, max_operators, max_reviews, headless, resume, concurrent):
     """Scrape reviews from safari booking sites."""
     db = ctx.obj["db"]
 
-    async def run_scrapers():
-        total_reviews = 0
+    async def run_safaribookings(queue: asyncio.Queue) -> int:
+        console.print("\n[bold blue]Scraping Safaribookings.com...[/]")
+        limiter = AdaptiveLimiter() if concurrent else None
+        scraper = SafaribookingsScraper(headless=headless, limiter=limiter)
+
+        try:
+            reviews = await scraper.scrape_all(
+                max_operators=max_operators,
+                max_reviews_per_operator=max_reviews,
+                resume=resume,
+                queue=queue,
+            )
+
+            console.print(f"[green]Scraped {len(reviews)} reviews from Safaribookings[/]")
+            return len(reviews)
+
+        except Exception as e:
+            console.print(f"[red]Error scraping Safaribookings: {e}[/]")
+            return 0
+
+        finally:
+            await queue.put(None)  # Tell the writer this producer is done
+
+    async def run_tripadvisor(queue: asyncio.Queue) -> int:
+        console.print("\n[bold blue]Scraping TripAdvisor...[/]")
+        scraper = TripAdvisorScraper(headless=headless)
+
+        try:
+            reviews = await scraper.scrape_all(
+                regions=["kenya", "tanzania"],
+                max_operators=max_operators,
+                max_reviews_per_operator=max_reviews,
+                resume=resume,
+                queue=queue,
+            )
+
+            console.print(f"[green]Scraped {len(reviews)} reviews from TripAdvisor[/]")
+            return len(reviews)
+
+        except Exception as e:
+            console.print(f"[red]Error scraping TripAdvisor: {e}[/]")
+            return 0
+
+        finally:
+            await queue.put(None)
+
+    async def write_reviews(queue: asyncio.Queue, producers: int):
+        # Saves reviews as they arrive, on a thread so scrapers keep running
+        pending = []
+        while producers:
+            review = await queue.get()
+            if review is None:
+                producers -= 1
+                continue
+
+            pending.append(review)
+            if len(pending) >= SCRAPE_WRITE_BATCH_SIZE:
+                await asyncio.to_thread(db.insert_reviews, pending)
+                pending = []
+
+        await asyncio.to_thread(db.insert_reviews, pending)
 
+    async def run_scrapers():
+        # Both sources are network-bound and independent, so run them together
+        queue = asyncio.Queue()
+        producers = []
         if source in ["safaribookings", "all"]:
-            console.print("\n[bold blue]Scraping Safaribookings.com...[/]")
-            scraper = SafaribookingsScraper(headless=headless)
-
-            try:
-                reviews = await scraper.scrape_all(
-                    max_operators=max_operators,
-                    max_reviews_per_operator=max_reviews,
-                    resume=resume,
-                )
-
-                for review in reviews:
-                    db.insert_review(review)
-
-                total_reviews += len(reviews)
-                console.print(f"[green]Saved {len(reviews)} reviews from Safaribookings[/]")
-
-            except Exception as e:
-                console.print(f"[red]Error scraping Safaribookings: {e}[/]")
-
+            producers.append(run_safaribookings(queue))
         if source in ["tripadvisor", "all"]:
-            console.print("\n[bold blue]Scraping TripAdvisor...[/]")
-            scraper = TripAdvisorScraper(headless=headless)
-
-            try:
-                reviews = await scraper.scrape_all(
-                    regions=["kenya", "tanzania"],
-                    max_operators=max_operators,
-                    max_reviews_per_operator=max_reviews,
-                    resume=resume,
-                )
-
-                for review in reviews:
-                    db.insert_review(review)
-
-                total_reviews += len(reviews)
-                console.print(f"[green]Saved {len(reviews)} reviews from TripAdvisor[/]")
-
-            except Exception as e:
-                console.print(f"[red]Error scraping TripAdvisor: {e}[/]")
+            producers.append(run_tripadvisor(queue))
 
-        return total_reviews
+        *counts, _ = await asyncio.gather(*producers, write_reviews(queue, len(producers)))
+        return sum(counts)
 
-    total = asyncio.run(run_scrapers())
+    # Review indexes are rebuilt once after the run rather than per insert
+    with db.bulk_ingest():
+        total = asyncio.run(run_scrapers())
     console.print(f"\n[bold green]Total reviews scraped: {total}[/]")
     console.print(f"[dim]Database: {db.db_path}[/]")
 
 
 @main.command()
+@click.option("--workers", type=int, default=None,
+              help="Analysis worker processes (default: CPU count, up to 8)")
 @click.pass_context
-def analyze(ctx):
+def analyze(ctx, workers):
     """Run analysis on all scraped reviews."""
     db = ctx.obj["db"]
+    workers = workers or default_workers()
 
     console.print("\n[bold blue]Running Analysis...[/]")
 
-    # Get unanalyzed reviews
-    reviews = db.get_unanalyzed_reviews()
+    # Unanalyzed reviews are streamed, counted up front for the progress bar;
+    # with none left, everything is re-analyzed
+    total = db.get_unanalyzed_review_count()
+    all_reviews = None
+    if not total:
+        all_reviews = db.get_reviews()
+        total = len(all_reviews)
 
-    if not reviews:
-        reviews = db.get_reviews()
-
-    if not reviews:
+    if not total:
         console.print("[yellow]No reviews found. Run 'scrape' first.[/]")
         return
 
-    console.print(f"Analyzing {len(reviews)} reviews...")
-
-    guide_analyzer = GuideAnalyzer()
-    factor_analyzer = DecisionFactorAnalyzer()
-    demo_analyzer = DemographicsAnalyzer()
+    console.print(f"Analyzing {total} reviews...")
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        refresh_per_second=4,
     ) as progress:
-        task = progress.add_task("Analyzing reviews...", total=len(reviews))
+        task = progress.add_task("Analyzing reviews...", total=total)
+
+        if workers > 1:
+            # Workers read their chunk of reviews themselves; this process only writes
+            if all_reviews is None:
+                review_ids = db.get_unanalyzed_review_ids()
+            else:
+                review_ids = [review.id for review in all_reviews]
+            id_chunks = [
+                review_ids[start:start + ANALYZE_CHUNK_SIZE]
+                for start in range(0, len(review_ids), ANALYZE_CHUNK_SIZE)
+            ]
+
+            for guide_results, factor_results, demo_results in iter_analysis_results(
+                str(db.db_path), id_chunks, workers
+            ):
+                db.insert_analysis_results(guide_results, factor_results, demo_results)
+                progress.advance(task, len(guide_results))
+
+        else:
+            reviews = db.iter_unanalyzed_reviews() if all_reviews is None else all_reviews
+            guide_analyzer = GuideAnalyzer()
+            factor_analyzer = DecisionFactorAnalyzer()
+            demo_analyzer = DemographicsAnalyzer()
+
+            # Results are buffered and written in one transaction per flush
+            guide_results = []
+            factor_results = []
+            demo_results = []
+
+            done = 0
+
+            def flush():
+                db.insert_analysis_results(guide_results, factor_results, demo_results)
+                guide_results.clear()
+                factor_results.clear()
+                demo_results.clear()
 
-        for review in reviews:
-            # Guide analysis
-            guide_result = guide_analyzer.analyze(review)
-            db.insert_guide_analysis(guide_result)
+            for review in reviews:
+                # Lowercased text, tokens and sentences shared by all analyzers
+                review_ctx = ReviewContext.from_review(review)
 
-            # Decision factors
-            factors = factor_analyzer.analyze(review)
-            for factor in factors:
-                db.insert_decision_factor(factor)
+                # Guide analysis
+                guide_results.append(guide_analyzer.analyze(review, review_ctx))
 
-            # Demographics
-            demo = demo_analyzer.analyze(review)
-            db.insert_demographic(demo)
+                # Decision factors
+                factor_results.extend(factor_analyzer.analyze(review, review_ctx))
 
-            progress.advance(task)
+                # Demographics
+                demo_results.append(demo_analyzer.analyze(review, review_ctx))
+
+                if len(guide_results) >= ANALYZE_FLUSH_SIZE:
+                    flush()
+
+                # Advance in coarse ticks; per-review updates only add overhead
+                done += 1
+                if done % PROGRESS_TICK == 0:
+                    progress.advance(task, PROGRESS_TICK)
+
+            flush()
+            progress.advance(task, done % PROGRESS_TICK)
 
     console.print("[green]Analysis complete![/]")
 
@@ -146,36 +238,31 @@ def stats(ctx):
     # Overview stats
     console.print(Panel.fit("[bold]Safari Review Analysis[/]", border_style="blue"))
 
-    # Review counts
-    total = db.get_review_count()
-    safaribookings = db.get_review_count("safaribookings")
-    tripadvisor = db.get_review_count("tripadvisor")
+    # Review counts and guide mention stats
+    overview = db.get_overview()
 
     table = Table(title="Review Counts")
     table.add_column("Source", style="cyan")
     table.add_column("Count", style="green")
-    table.add_row("Safaribookings", str(safaribookings))
-    table.add_row("TripAdvisor", str(tripadvisor))
-    table.add_row("[bold]Total[/]", f"[bold]{total}[/]")
+    table.add_row("Safaribookings", str(overview["safaribookings"]))
+    table.add_row("TripAdvisor", str(overview["tripadvisor"]))
+    table.add_row("[bold]Total[/]", f"[bold]{overview['total_reviews']}[/]")
     console.print(table)
 
-    # Guide mention stats
-    guide_stats = db.get_guide_mention_stats()
-
-    if guide_stats["total_analyzed"] > 0:
+    if overview["total_analyzed"] > 0:
         console.print("\n")
         table = Table(title="Safari Guide Analysis")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
-        table.add_row("Reviews Analyzed", str(guide_stats["total_analyzed"]))
-        table.add_row("Mention Guide", str(guide_stats["mentions_guide"]))
+        table.add_row("Reviews Analyzed", str(overview["total_analyzed"]))
+        table.add_row("Mention Guide", str(overview["mentions_guide"]))
         table.add_row(
             "Guide Mention Rate",
-            f"{guide_stats['guide_mention_rate']:.1f}%"
+            f"{overview['guide_mention_rate']:.1f}%"
         )
         table.add_row(
             "Avg Guide Sentiment",
-            f"{guide_stats['avg_guide_sentiment']:.2f}"
+            f"{overview['avg_guide_sentiment']:.2f}"
         )
         console.print(table)
 
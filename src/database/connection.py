@@ -1,11 +1,335 @@
 """Database connection and operations."""
+import re
 import sqlite3
+import threading
+import weakref
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Iterator, Optional
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
+
+import orjson
 
 from .models import Review, GuideAnalysis, DecisionFactor, Demographic
 
+# Columns written on insert, in the order of the matching _*_params builder
+REVIEW_INSERT_COLUMNS = (
+    "source", "url", "operator_name", "reviewer_name", "reviewer_location",
+    "reviewer_country", "rating", "title", "text", "travel_date",
+    "review_date", "trip_type", "scraped_at",
+    "reviewer_contributions", "reviewer_helpful_votes", "helpful_votes",
+    "review_id_source", "age_range", "parks_visited", "wildlife_sightings",
+    "guide_names_mentioned", "safari_duration_days", "parsing_confidence",
+    "raw_text_block", "parse_warnings",
+)
+GUIDE_ANALYSIS_INSERT_COLUMNS = (
+    "review_id", "mentions_guide", "guide_names", "guide_keywords_found",
+    "sentiment_score", "sentiment_label", "guide_context",
+)
+DECISION_FACTOR_INSERT_COLUMNS = (
+    "review_id", "factor_type", "mentions", "sentiment_score", "importance_score",
+)
+DEMOGRAPHIC_INSERT_COLUMNS = (
+    "review_id", "country", "region", "travel_composition",
+    "party_size", "experience_level", "age_indicator",
+)
+
+# Secondary indexes on reviews, dropped during bulk ingest (url keeps its
+# UNIQUE index for deduplication)
+REVIEW_INDEXES = {
+    "idx_reviews_source": "CREATE INDEX IF NOT EXISTS idx_reviews_source ON reviews(source)",
+    "idx_reviews_country": "CREATE INDEX IF NOT EXISTS idx_reviews_country ON reviews(reviewer_country)",
+    "idx_reviews_operator": "CREATE INDEX IF NOT EXISTS idx_reviews_operator ON reviews(operator_name)",
+    "idx_reviews_scraped_at": "CREATE INDEX IF NOT EXISTS idx_reviews_scraped_at ON reviews(scraped_at)",
+    "idx_reviews_rating": "CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews(rating)",
+    "idx_reviews_id_desc": "CREATE INDEX IF NOT EXISTS idx_reviews_id_desc ON reviews(id DESC)",
+}
+
+# WAL lets readers run alongside the analyze writer; NORMAL sync is safe under WAL.
+# page_size comes first: it only takes effect on a new database, before WAL is on
+CONNECTION_PRAGMAS = """
+    PRAGMA page_size=32768;
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Bound-parameter limit of SQLite builds before 3.32, used when the
+# connection can't report its own
+SQLITE_MAX_VARIABLES = 999
+
+# Cap on parameters per statement (the 3.32+ default) so builds with a
+# raised limit don't produce multi-megabyte SQL strings
+MAX_STATEMENT_VARIABLES = 32766
+
+
+@lru_cache(maxsize=64)
+def _insert_sql(table: str, columns: tuple[str, ...], rows: int = 1, verb: str = "INSERT") -> str:
+    """Build an INSERT with one VALUES tuple per row, cached per row count."""
+    placeholders = f"({', '.join('?' * len(columns))})"
+    return (
+        f"{verb} INTO {table} ({', '.join(columns)}) "
+        f"VALUES {', '.join([placeholders] * rows)}"
+    )
+
+
+@lru_cache(maxsize=64)
+def _insert_by_url_sql(
+    table: str, columns: tuple[str, ...], rows: int, verb: str = "INSERT"
+) -> str:
+    """Build an INSERT ... SELECT whose VALUES rows carry a review URL in place of review_id."""
+    placeholders = f"({', '.join('?' * len(columns))})"
+    values = ", ".join(["r.id"] + [f"v.column{i}" for i in range(2, len(columns) + 1)])
+    return (
+        f"{verb} INTO {table} ({', '.join(columns)}) "
+        f"SELECT {values} FROM (VALUES {', '.join([placeholders] * rows)}) v "
+        f"JOIN reviews r ON r.url = v.column1"
+    )
+
+
+# Single-row statements, built once so every call hands sqlite3 the same
+# string and hits its per-connection statement cache
+REVIEW_INSERT_OR_IGNORE_SQL = _insert_sql("reviews", REVIEW_INSERT_COLUMNS, verb="INSERT OR IGNORE")
+# The no-op update makes RETURNING yield the existing row on a duplicate URL
+REVIEW_UPSERT_SQL = (
+    _insert_sql("reviews", REVIEW_INSERT_COLUMNS)
+    + " ON CONFLICT(url) DO UPDATE SET url = excluded.url RETURNING id"
+)
+
+# UPSERT arrived in SQLite 3.24 and RETURNING in 3.35
+UPSERT_RETURNING_AVAILABLE = sqlite3.sqlite_version_info >= (3, 35)
+
+# Analysis rows are keyed on their review, so re-analyzing replaces them
+ANALYSIS_INSERT_VERB = "INSERT OR REPLACE"
+GUIDE_ANALYSIS_INSERT_SQL = _insert_sql(
+    "guide_analysis", GUIDE_ANALYSIS_INSERT_COLUMNS, verb=ANALYSIS_INSERT_VERB
+)
+DECISION_FACTOR_INSERT_SQL = _insert_sql(
+    "decision_factors", DECISION_FACTOR_INSERT_COLUMNS, verb=ANALYSIS_INSERT_VERB
+)
+DEMOGRAPHIC_INSERT_SQL = _insert_sql(
+    "demographics", DEMOGRAPHIC_INSERT_COLUMNS, verb=ANALYSIS_INSERT_VERB
+)
+
+# Room for the single-row statements, every multi-row chunk size and the queries
+STATEMENT_CACHE_SIZE = 256
+
+
+def _insert_rows(
+    cursor: sqlite3.Cursor,
+    table: str,
+    columns: tuple[str, ...],
+    rows: Iterable[tuple],
+    max_variables: int,
+    verb: str = "INSERT",
+):
+    """Insert rows with multi-row VALUES statements sized under the parameter limit."""
+    chunk_size = max(1, max_variables // len(columns))
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        cursor.execute(
+            _insert_sql(table, columns, len(chunk), verb),
+            list(chain.from_iterable(chunk)),
+        )
+
+# update_scrape_run keyword arguments and the scrape_runs columns they set
+SCRAPE_RUN_UPDATE_COLUMNS = {
+    "status": "status",
+    "operators_total": "operators_total",
+    "operators_completed": "operators_completed",
+    "reviews_collected": "reviews_collected",
+    "errors": "errors_json",
+}
+
+# Statuses that mark a scrape run as ended
+FINISHED_RUN_STATUSES = frozenset({"completed", "stopped", "failed"})
+
+# Per-review analysis tables, WITHOUT ROWID and clustered on review_id.
+# Databases from before that still have a synthetic id column and are
+# rebuilt by _migrate_analysis_tables
+ANALYSIS_TABLES = ("guide_analysis", "decision_factors", "demographics")
+
+# Insert columns of each analysis table, which are all of its columns
+ANALYSIS_TABLE_COLUMNS = {
+    "guide_analysis": GUIDE_ANALYSIS_INSERT_COLUMNS,
+    "decision_factors": DECISION_FACTOR_INSERT_COLUMNS,
+    "demographics": DEMOGRAPHIC_INSERT_COLUMNS,
+}
+
+# Tables written by the exporters, one file each
+EXPORT_TABLES = ("reviews",) + ANALYSIS_TABLES
+
+
+def _write_json_array(f: BinaryIO, items: Iterable[dict]):
+    """Write items to a binary file as an indented JSON array, one element at a time."""
+    first = True
+    for item in items:
+        f.write(b"[\n  " if first else b",\n  ")
+        f.write(orjson.dumps(item, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+        first = False
+    f.write(b"[]" if first else b"\n]")
+
+
+# Review columns in dataclass field order, so rows map onto Review positionally
+# whatever order migrations left the table columns in
+REVIEW_SELECT_COLUMNS = ", ".join(("id",) + REVIEW_INSERT_COLUMNS)
+
+
+def _review_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Review:
+    """Build a Review straight from a row selected with REVIEW_SELECT_COLUMNS."""
+    return Review(*row)
+
+
+def _review_params(review: Review) -> tuple:
+    return (
+        review.source, review.url, review.operator_name, review.reviewer_name,
+        review.reviewer_location, review.reviewer_country, review.rating,
+        review.title, review.text, review.travel_date, review.review_date,
+        review.trip_type, review.scraped_at,
+        review.reviewer_contributions, review.reviewer_helpful_votes,
+        review.helpful_votes, review.review_id_source, review.age_range,
+        review.parks_visited, review.wildlife_sightings,
+        review.guide_names_mentioned, review.safari_duration_days,
+        review.parsing_confidence, review.raw_text_block, review.parse_warnings,
+    )
+
+
+def _guide_analysis_params(analysis: GuideAnalysis) -> tuple:
+    return (
+        analysis.review_id, analysis.mentions_guide, analysis.guide_names,
+        analysis.guide_keywords_found, analysis.sentiment_score,
+        analysis.sentiment_label, analysis.guide_context,
+    )
+
+
+def _decision_factor_params(factor: DecisionFactor) -> tuple:
+    return (
+        factor.review_id, factor.factor_type, factor.mentions,
+        factor.sentiment_score, factor.importance_score,
+    )
+
+
+def _demographic_params(demo: Demographic) -> tuple:
+    return (
+        demo.review_id, demo.country, demo.region, demo.travel_composition,
+        demo.party_size, demo.experience_level, demo.age_indicator,
+    )
+
+# Full-text index over review text, kept in sync with reviews by triggers
+REVIEWS_FTS_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts
+    USING fts5(text, content='reviews', content_rowid='id')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN
+        INSERT INTO reviews_fts(rowid, text) VALUES (new.id, new.text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN
+        INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF text ON reviews BEGIN
+        INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        INSERT INTO reviews_fts(rowid, text) VALUES (new.id, new.text);
+    END
+    """,
+]
+
+# Reviews get_guide_intelligence treats as mentioning a guide: any word
+# starting with "guide" or "driver" via the FTS index, or a substring
+# scan when SQLite lacks FTS5
+GUIDE_MENTION_FTS_SQL = (
+    "(reviews.id IN (SELECT rowid FROM reviews_fts WHERE reviews_fts MATCH 'guide* OR driver*'))"
+)
+GUIDE_MENTION_LIKE_SQL = "(LOWER(text) LIKE '%guide%' OR LOWER(text) LIKE '%driver%')"
+
+# Partial index over the rows matching the LIKE fallback, evaluated once per
+# insert; the planner uses it for queries whose WHERE repeats the condition
+GUIDE_MENTION_INDEX_SQL = (
+    f"CREATE INDEX IF NOT EXISTS idx_reviews_guide_mention ON reviews(id) "
+    f"WHERE {GUIDE_MENTION_LIKE_SQL}"
+)
+
+# Rating buckets reported by get_guide_intelligence, highest first
+RATING_GROUPS = ("5_stars", "4_stars", "3_stars", "2_stars", "1_star")
+
+# Guide qualities counted by get_guide_intelligence
+GUIDE_QUALITY_TERMS = [
+    (r'knowledgeable|knowledge', 'Knowledgeable'),
+    (r'experienced|experience', 'Experienced'),
+    (r'friendly|warm|welcoming', 'Friendly'),
+    (r'professional|professionalism', 'Professional'),
+    (r'helpful|accommodating', 'Helpful'),
+    (r'patient|patience', 'Patient'),
+    (r'informative|explained|explaining', 'Informative'),
+    (r'punctual|on time|timely', 'Punctual'),
+    (r'safe|safety|careful', 'Safety-conscious'),
+    (r'spot|spotting|spotted', 'Wildlife Spotting'),
+    (r'passionate|enthusiasm|enthusiastic', 'Passionate'),
+    (r'recommend|recommended', 'Highly Recommended'),
+]
+# Regex group name of each quality
+GUIDE_QUALITY_GROUPS = [(f'q{i}', quality) for i, (_, quality) in enumerate(GUIDE_QUALITY_TERMS)]
+
+# All qualities in one pass: each term is a whole word and no two qualities
+# share one, so the non-overlapping matches name every quality present
+GUIDE_QUALITY_RE = re.compile(r'\b(?:' + '|'.join(
+    f'(?P<{group}>{terms})'
+    for (group, _), (terms, _) in zip(GUIDE_QUALITY_GROUPS, GUIDE_QUALITY_TERMS)
+) + r')\b')
+
+# Sentiment phrases, each list matched as one alternation
+GUIDE_POSITIVE_PHRASES = [
+    'excellent guide', 'amazing guide', 'best guide', 'fantastic guide',
+    'wonderful guide', 'great guide', 'incredible guide', 'outstanding guide',
+    'our guide was amazing', 'our guide was excellent', 'our guide was fantastic',
+    'highly recommend', 'special thanks', 'shout out to', 'hats off to',
+    'couldn\'t have asked for', 'above and beyond', 'made our trip',
+    'highlight of', 'best part of'
+]
+GUIDE_NEGATIVE_PHRASES = [
+    'poor guide', 'bad guide', 'disappointing guide', 'guide was rude',
+    'unprofessional', 'inexperienced', 'guide didn\'t', 'guide was late',
+    'wouldn\'t recommend', 'not happy with'
+]
+GUIDE_POSITIVE_RE = re.compile('|'.join(map(re.escape, GUIDE_POSITIVE_PHRASES)))
+GUIDE_NEGATIVE_RE = re.compile('|'.join(map(re.escape, GUIDE_NEGATIVE_PHRASES)))
+
+# Extracted guide names that are really common words
+GUIDE_NAME_FALSE_POSITIVES = frozenset({
+    'who', 'you', 'and', 'the', 'our', 'we', 'they', 'he', 'she',
+    'it', 'was', 'were', 'been', 'being', 'have', 'has', 'had',
+    'success', 'gave', 'made', 'took', 'got', 'went', 'came',
+})
+
+
+def read_reviews(db_path: str | Path, review_ids: list[int]) -> list[Review]:
+    """Read reviews by ID over a read-only connection, e.g. from a worker process."""
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = _review_row_factory
+        reviews = []
+        for start in range(0, len(review_ids), SQLITE_MAX_VARIABLES):
+            chunk = review_ids[start:start + SQLITE_MAX_VARIABLES]
+            cursor.execute(
+                f"SELECT {REVIEW_SELECT_COLUMNS} FROM reviews "
+                f"WHERE id IN ({', '.join('?' * len(chunk))}) ORDER BY id",
+                chunk,
+            )
+            reviews.extend(cursor.fetchall())
+        return reviews
+    finally:
+        conn.close()
+
 
 class Database:
     """SQLite database manager for safari reviews."""
@@ -13,22 +337,51 @@ class Database:
     def __init__(self, db_path: str = "data/reviews.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection per instance, shared across threads behind a lock
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(CONNECTION_PRAGMAS)
+        self._lock = threading.RLock()
+        self._max_variables = self._variable_limit()
+        # Closes on garbage collection or, failing that, at interpreter exit
+        self._finalizer = weakref.finalize(self, self._conn.close)
+
         self._init_db()
 
     @contextmanager
     def _get_connection(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        with self._lock:
+            try:
+                yield self._conn
+            except BaseException:
+                # Don't leave a half-written transaction on the shared connection
+                self._conn.rollback()
+                raise
+
+    def _variable_limit(self) -> int:
+        """Bound-parameter limit of the linked SQLite library."""
         try:
-            yield conn
-        finally:
-            conn.close()
+            limit = self._conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        except AttributeError:  # Python < 3.11
+            return SQLITE_MAX_VARIABLES
+        return min(limit, MAX_STATEMENT_VARIABLES)
+
+    def close(self):
+        """Close the database connection."""
+        self._finalizer()
 
     def _init_db(self):
         """Initialize database schema."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
+            # sqlite3 doesn't open a transaction for DDL, so without this each
+            # statement below would commit on its own
+            cursor.execute("BEGIN IMMEDIATE")
+
             # Reviews table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS reviews (
@@ -64,11 +417,14 @@ class Database:
             # Run migration for existing databases
             self._migrate_db(cursor)
 
+            # Analysis tables with the old layout are set aside and copied
+            # into the tables created below
+            legacy_tables = self._set_aside_legacy_analysis_tables(cursor)
+
             # Guide analysis table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS guide_analysis (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    review_id INTEGER NOT NULL,
+                    review_id INTEGER NOT NULL PRIMARY KEY,
                     mentions_guide BOOLEAN,
                     guide_names TEXT,
                     guide_keywords_found TEXT,
@@ -76,27 +432,26 @@ class Database:
                     sentiment_label TEXT,
                     guide_context TEXT,
                     FOREIGN KEY (review_id) REFERENCES reviews(id)
-                )
+                ) WITHOUT ROWID
             """)
 
             # Decision factors table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS decision_factors (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
                     review_id INTEGER NOT NULL,
-                    factor_type TEXT,
+                    factor_type TEXT NOT NULL,
                     mentions TEXT,
                     sentiment_score REAL,
                     importance_score REAL,
+                    PRIMARY KEY (review_id, factor_type),
                     FOREIGN KEY (review_id) REFERENCES reviews(id)
-                )
+                ) WITHOUT ROWID
             """)
 
             # Demographics table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS demographics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    review_id INTEGER NOT NULL,
+                    review_id INTEGER NOT NULL PRIMARY KEY,
                     country TEXT,
                     region TEXT,
                     travel_composition TEXT,
@@ -104,9 +459,15 @@ class Database:
                     experience_level TEXT,
                     age_indicator TEXT,
                     FOREIGN KEY (review_id) REFERENCES reviews(id)
-                )
+                ) WITHOUT ROWID
             """)
 
+            if self._init_fts(cursor):
+                self._guide_mention_sql = GUIDE_MENTION_FTS_SQL
+            else:
+                cursor.execute(GUIDE_MENTION_INDEX_SQL)
+                self._guide_mention_sql = GUIDE_MENTION_LIKE_SQL
+
             # Scrape runs table for run history
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS scrape_runs (
@@ -124,17 +485,10 @@ class Database:
             """)
 
             # Create indexes for common queries
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_source ON reviews(source)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_country ON reviews(reviewer_country)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_operator ON reviews(operator_name)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_scraped_at ON reviews(scraped_at)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews(rating)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_id_desc ON reviews(id DESC)")
-
-            # Foreign key indexes for JOINs
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_guide_analysis_review_id ON guide_analysis(review_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_factors_review_id ON decision_factors(review_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_demographics_review_id ON demographics(review_id)")
+            for statement in REVIEW_INDEXES.values():
+                cursor.execute(statement)
+
+            self._migrate_analysis_tables(cursor, legacy_tables)
 
             # Other indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_guide_mentions ON guide_analysis(mentions_guide)")
@@ -144,6 +498,74 @@ class Database:
 
             conn.commit()
 
+    def _init_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the review full-text index, returns False if FTS5 is unavailable."""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'reviews_fts'")
+        existed = cursor.fetchone() is not None
+
+        try:
+            for statement in REVIEWS_FTS_SCHEMA:
+                cursor.execute(statement)
+        except sqlite3.OperationalError:
+            return False  # SQLite built without FTS5
+
+        if not existed:
+            # Index reviews stored before the table existed
+            cursor.execute("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')")
+        return True
+
+    @contextmanager
+    def bulk_ingest(self):
+        """Drop the secondary review indexes while inserting, rebuilding them on exit.
+
+        Building each index once after a large load is cheaper than
+        updating it on every insert.
+        """
+        with self._get_connection() as conn:
+            for name in REVIEW_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+            conn.commit()
+
+        try:
+            yield self
+        finally:
+            with self._get_connection() as conn:
+                for statement in REVIEW_INDEXES.values():
+                    conn.execute(statement)
+                conn.commit()
+
+    @staticmethod
+    def _has_column(cursor: sqlite3.Cursor, table: str, column: str) -> bool:
+        cursor.execute(f"SELECT 1 FROM pragma_table_info('{table}') WHERE name = ?", (column,))
+        return cursor.fetchone() is not None
+
+    def _set_aside_legacy_analysis_tables(self, cursor: sqlite3.Cursor) -> list[str]:
+        """Rename analysis tables that still have a synthetic id column, returns their names."""
+        legacy_tables = []
+        for table in ANALYSIS_TABLES:
+            if self._has_column(cursor, table, "id"):
+                # Their indexes move with the table and are dropped with it
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+                legacy_tables.append(table)
+        return legacy_tables
+
+    def _migrate_analysis_tables(self, cursor: sqlite3.Cursor, legacy_tables: list[str]):
+        """Copy set-aside analysis rows into the keyed tables and drop the old ones.
+
+        Re-running analysis used to append a second set of rows for a
+        review; copying in id order keeps the most recent one.
+        """
+        for table in legacy_tables:
+            columns = ANALYSIS_TABLE_COLUMNS[table]
+            key_columns = ("review_id", "factor_type") if table == "decision_factors" else ("review_id",)
+            cursor.execute(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(columns)} FROM {table}_legacy "
+                f"WHERE {' AND '.join(f'{column} IS NOT NULL' for column in key_columns)} "
+                f"ORDER BY id"
+            )
+            cursor.execute(f"DROP TABLE {table}_legacy")
+
     def _migrate_db(self, cursor):
         """Apply database migrations for new columns on existing databases."""
         new_columns = [
@@ -161,118 +583,220 @@ class Database:
             ("parse_warnings", "TEXT DEFAULT '[]'"),
         ]
 
+        cursor.execute("SELECT name FROM pragma_table_info('reviews')")
+        existing = {row[0] for row in cursor.fetchall()}
         for col_name, col_def in new_columns:
-            try:
+            if col_name not in existing:
                 cursor.execute(f"ALTER TABLE reviews ADD COLUMN {col_name} {col_def}")
-            except sqlite3.OperationalError:
-                pass  # Column already exists
 
     def insert_review(self, review: Review) -> int:
         """Insert a review, returns the ID. Skips if URL already exists."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            try:
-                cursor.execute("""
-                    INSERT INTO reviews (
-                        source, url, operator_name, reviewer_name, reviewer_location,
-                        reviewer_country, rating, title, text, travel_date,
-                        review_date, trip_type, scraped_at,
-                        reviewer_contributions, reviewer_helpful_votes, helpful_votes,
-                        review_id_source, age_range, parks_visited, wildlife_sightings,
-                        guide_names_mentioned, safari_duration_days, parsing_confidence,
-                        raw_text_block, parse_warnings
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    review.source, review.url, review.operator_name, review.reviewer_name,
-                    review.reviewer_location, review.reviewer_country, review.rating,
-                    review.title, review.text, review.travel_date, review.review_date,
-                    review.trip_type, review.scraped_at,
-                    review.reviewer_contributions, review.reviewer_helpful_votes,
-                    review.helpful_votes, review.review_id_source, review.age_range,
-                    review.parks_visited, review.wildlife_sightings,
-                    review.guide_names_mentioned, review.safari_duration_days,
-                    review.parsing_confidence, review.raw_text_block, review.parse_warnings
-                ))
-                conn.commit()
+            if UPSERT_RETURNING_AVAILABLE:
+                # One statement returns the new or the existing row's ID
+                try:
+                    cursor.execute(REVIEW_UPSERT_SQL, _review_params(review))
+                    row = cursor.fetchone()
+                    conn.commit()
+                    return row[0]
+                except sqlite3.IntegrityError:
+                    # Violates a constraint other than url uniqueness
+                    conn.rollback()
+                    return -1
+
+            cursor.execute(REVIEW_INSERT_OR_IGNORE_SQL, _review_params(review))
+            conn.commit()
+            if cursor.rowcount:
                 return cursor.lastrowid
-            except sqlite3.IntegrityError:
-                # URL already exists, get existing ID
-                cursor.execute("SELECT id FROM reviews WHERE url = ?", (review.url,))
-                row = cursor.fetchone()
-                return row["id"] if row else -1
+
+            # URL already exists, get existing ID
+            cursor.execute("SELECT id FROM reviews WHERE url = ?", (review.url,))
+            row = cursor.fetchone()
+            return row["id"] if row else -1
+
+    def insert_reviews(self, reviews: list[Review]) -> list[int]:
+        """Insert reviews in one transaction, returns their IDs in input order.
+
+        Reviews whose URL already exists are skipped and get the existing ID.
+        """
+        if not reviews:
+            return []
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # sqlite3 opens a single transaction before the first INSERT
+            _insert_rows(
+                cursor, "reviews", REVIEW_INSERT_COLUMNS,
+                map(_review_params, reviews), self._max_variables,
+                verb="INSERT OR IGNORE",
+            )
+            conn.commit()
+
+            # Resolve IDs for new and pre-existing URLs alike
+            urls = list(dict.fromkeys(review.url for review in reviews))
+            ids = {}
+            for start in range(0, len(urls), self._max_variables):
+                chunk = urls[start:start + self._max_variables]
+                cursor.execute(
+                    f"SELECT id, url FROM reviews WHERE url IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                ids.update({row["url"]: row["id"] for row in cursor.fetchall()})
+
+            return [ids.get(review.url, -1) for review in reviews]
 
     def insert_guide_analysis(self, analysis: GuideAnalysis) -> int:
-        """Insert guide analysis."""
+        """Insert guide analysis, returns the review ID it is keyed on."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO guide_analysis (
-                    review_id, mentions_guide, guide_names, guide_keywords_found,
-                    sentiment_score, sentiment_label, guide_context
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                analysis.review_id, analysis.mentions_guide, analysis.guide_names,
-                analysis.guide_keywords_found, analysis.sentiment_score,
-                analysis.sentiment_label, analysis.guide_context
-            ))
+            cursor.execute(GUIDE_ANALYSIS_INSERT_SQL, _guide_analysis_params(analysis))
             conn.commit()
-            return cursor.lastrowid
+            return analysis.review_id
 
     def insert_decision_factor(self, factor: DecisionFactor) -> int:
-        """Insert decision factor."""
+        """Insert decision factor, returns the review ID it is keyed on."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO decision_factors (
-                    review_id, factor_type, mentions, sentiment_score, importance_score
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
-                factor.review_id, factor.factor_type, factor.mentions,
-                factor.sentiment_score, factor.importance_score
-            ))
+            cursor.execute(DECISION_FACTOR_INSERT_SQL, _decision_factor_params(factor))
             conn.commit()
-            return cursor.lastrowid
+            return factor.review_id
 
     def insert_demographic(self, demo: Demographic) -> int:
-        """Insert demographic data."""
+        """Insert demographic data, returns the review ID it is keyed on."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO demographics (
-                    review_id, country, region, travel_composition,
-                    party_size, experience_level, age_indicator
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                demo.review_id, demo.country, demo.region, demo.travel_composition,
-                demo.party_size, demo.experience_level, demo.age_indicator
-            ))
+            cursor.execute(DEMOGRAPHIC_INSERT_SQL, _demographic_params(demo))
+            conn.commit()
+            return demo.review_id
+
+    def insert_guide_analyses(self, analyses: list[GuideAnalysis]):
+        """Insert guide analyses in one transaction."""
+        self.insert_analysis_results(guide_analyses=analyses)
+
+    def insert_guide_analyses_by_url(self, analyses: Iterable[tuple[str, GuideAnalysis]]) -> int:
+        """Insert guide analyses keyed by review URL, resolving review IDs in SQL.
+
+        Analyses whose URL has no stored review are skipped. Returns the
+        number of rows inserted.
+        """
+        columns = GUIDE_ANALYSIS_INSERT_COLUMNS
+        chunk_size = max(1, self._max_variables // len(columns))
+        rows = ((url,) + _guide_analysis_params(analysis)[1:] for url, analysis in analyses)
+        inserted = 0
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            while chunk := list(islice(rows, chunk_size)):
+                cursor.execute(
+                    _insert_by_url_sql("guide_analysis", columns, len(chunk), ANALYSIS_INSERT_VERB),
+                    list(chain.from_iterable(chunk)),
+                )
+                inserted += cursor.rowcount
+            conn.commit()
+        return inserted
+
+    def insert_decision_factors(self, factors: list[DecisionFactor]):
+        """Insert decision factors in one transaction."""
+        self.insert_analysis_results(decision_factors=factors)
+
+    def insert_demographics(self, demos: list[Demographic]):
+        """Insert demographic data in one transaction."""
+        self.insert_analysis_results(demographics=demos)
+
+    def insert_analysis_results(
+        self,
+        guide_analyses: Iterable[GuideAnalysis] = (),
+        decision_factors: Iterable[DecisionFactor] = (),
+        demographics: Iterable[Demographic] = (),
+    ):
+        """Insert results for all three analysis tables in a single transaction.
+
+        Rows for an already analyzed review replace the stored ones.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for table, columns, rows in (
+                ("guide_analysis", GUIDE_ANALYSIS_INSERT_COLUMNS,
+                 map(_guide_analysis_params, guide_analyses)),
+                ("decision_factors", DECISION_FACTOR_INSERT_COLUMNS,
+                 map(_decision_factor_params, decision_factors)),
+                ("demographics", DEMOGRAPHIC_INSERT_COLUMNS,
+                 map(_demographic_params, demographics)),
+            ):
+                _insert_rows(
+                    cursor, table, columns, rows, self._max_variables, ANALYSIS_INSERT_VERB
+                )
             conn.commit()
-            return cursor.lastrowid
 
     def get_reviews(self, source: Optional[str] = None, limit: int = 1000) -> list[Review]:
         """Get reviews, optionally filtered by source."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = _review_row_factory
             if source:
                 cursor.execute(
-                    "SELECT * FROM reviews WHERE source = ? LIMIT ?",
+                    f"SELECT {REVIEW_SELECT_COLUMNS} FROM reviews WHERE source = ? LIMIT ?",
                     (source, limit)
                 )
             else:
-                cursor.execute("SELECT * FROM reviews LIMIT ?", (limit,))
+                cursor.execute(f"SELECT {REVIEW_SELECT_COLUMNS} FROM reviews LIMIT ?", (limit,))
 
-            return [Review.from_dict(dict(row)) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
     def get_unanalyzed_reviews(self) -> list[Review]:
         """Get reviews that haven't been analyzed yet."""
+        return list(self.iter_unanalyzed_reviews())
+
+    def iter_unanalyzed_reviews(self, page_size: int = 1000) -> Iterator[Review]:
+        """Yield reviews that haven't been analyzed yet, reading page_size rows at a time.
+
+        Pages are keyed on review id and the lock is released between them,
+        so callers can write analysis results while iterating.
+        """
+        last_id = 0
+        while True:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = _review_row_factory
+                cursor.execute(f"""
+                    SELECT {REVIEW_SELECT_COLUMNS} FROM reviews r
+                    WHERE r.id > ? AND NOT EXISTS (
+                        SELECT 1 FROM guide_analysis ga WHERE ga.review_id = r.id
+                    )
+                    ORDER BY r.id
+                    LIMIT ?
+                """, (last_id, page_size))
+                reviews = cursor.fetchall()
+
+            if not reviews:
+                return
+            yield from reviews
+            last_id = reviews[-1].id
+
+    def get_unanalyzed_review_ids(self) -> list[int]:
+        """Get IDs of reviews that haven't been analyzed yet, in ID order."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT r.* FROM reviews r
-                LEFT JOIN guide_analysis ga ON r.id = ga.review_id
-                WHERE ga.id IS NULL
+                SELECT r.id FROM reviews r
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM guide_analysis ga WHERE ga.review_id = r.id
+                )
+                ORDER BY r.id
+            """)
+            return [row[0] for row in cursor.fetchall()]
+
+    def get_unanalyzed_review_count(self) -> int:
+        """Get the number of reviews that haven't been analyzed yet."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*) FROM reviews r
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM guide_analysis ga WHERE ga.review_id = r.id
+                )
             """)
-            return [Review.from_dict(dict(row)) for row in cursor.fetchall()]
+            return cursor.fetchone()[0]
 
     def get_review_count(self, source: Optional[str] = None) -> int:
         """Get total review count."""
@@ -333,126 +857,121 @@ class Database:
                     AVG(CASE WHEN mentions_guide = 1 THEN sentiment_score END) as avg_sentiment
                 FROM guide_analysis
             """)
+            return self._guide_stats(*cursor.fetchone())
+
+    def get_overview(self) -> dict:
+        """Get review counts per source and guide mention stats in one query."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT r.total, r.safaribookings, r.tripadvisor,
+                       g.total, g.with_guide, g.avg_sentiment
+                FROM (
+                    SELECT
+                        COUNT(*) as total,
+                        SUM(source = 'safaribookings') as safaribookings,
+                        SUM(source = 'tripadvisor') as tripadvisor
+                    FROM reviews
+                ) r, (
+                    SELECT
+                        COUNT(*) as total,
+                        SUM(CASE WHEN mentions_guide = 1 THEN 1 ELSE 0 END) as with_guide,
+                        AVG(CASE WHEN mentions_guide = 1 THEN sentiment_score END) as avg_sentiment
+                    FROM guide_analysis
+                ) g
+            """)
             row = cursor.fetchone()
             return {
-                "total_analyzed": row[0] or 0,
-                "mentions_guide": row[1] or 0,
-                "guide_mention_rate": (row[1] / row[0] * 100) if row[0] else 0,
-                "avg_guide_sentiment": row[2] or 0,
+                "total_reviews": row[0],
+                "safaribookings": row[1] or 0,
+                "tripadvisor": row[2] or 0,
+                **self._guide_stats(row[3], row[4], row[5]),
             }
 
+    @staticmethod
+    def _guide_stats(total: int, with_guide: Optional[int], avg_sentiment: Optional[float]) -> dict:
+        return {
+            "total_analyzed": total or 0,
+            "mentions_guide": with_guide or 0,
+            "guide_mention_rate": (with_guide / total * 100) if total else 0,
+            "avg_guide_sentiment": avg_sentiment or 0,
+        }
+
     def get_guide_intelligence(self) -> dict:
         """Get comprehensive guide intelligence analysis."""
-        import re
-        import json
         from collections import Counter
 
+        mention = self._guide_mention_sql
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Basic stats
-            cursor.execute("SELECT COUNT(*) FROM reviews")
-            total_reviews = cursor.fetchone()[0] or 0
-
-            cursor.execute("""
-                SELECT COUNT(*) FROM reviews
-                WHERE LOWER(text) LIKE '%guide%' OR LOWER(text) LIKE '%driver%'
-            """)
-            guide_mentions = cursor.fetchone()[0] or 0
-
-            # Rating comparison
-            cursor.execute("""
-                SELECT AVG(rating) FROM reviews
-                WHERE LOWER(text) LIKE '%guide%' OR LOWER(text) LIKE '%driver%'
-            """)
-            avg_with_guide = cursor.fetchone()[0] or 0
-
-            cursor.execute("""
-                SELECT AVG(rating) FROM reviews
-                WHERE LOWER(text) NOT LIKE '%guide%' AND LOWER(text) NOT LIKE '%driver%'
-            """)
-            avg_without_guide = cursor.fetchone()[0] or 0
-
-            # Rating distribution for guide-mentioning reviews
-            cursor.execute("""
+            # Counts, rating comparison and the rating distribution of
+            # guide-mentioning reviews, all from one pass over reviews
+            cursor.execute(f"""
                 SELECT
-                    CASE
-                        WHEN rating >= 4.5 THEN '5_stars'
-                        WHEN rating >= 3.5 THEN '4_stars'
-                        WHEN rating >= 2.5 THEN '3_stars'
-                        WHEN rating >= 1.5 THEN '2_stars'
-                        ELSE '1_star'
-                    END as rating_group,
-                    COUNT(*)
-                FROM reviews
-                WHERE LOWER(text) LIKE '%guide%' OR LOWER(text) LIKE '%driver%'
-                GROUP BY rating_group
-                ORDER BY rating_group DESC
+                    COUNT(*),
+                    SUM(mentioned),
+                    AVG(CASE WHEN mentioned THEN rating END),
+                    AVG(CASE WHEN text IS NOT NULL AND NOT mentioned THEN rating END),
+                    {', '.join(
+                        f"SUM(CASE WHEN mentioned AND rating_group = '{group}' THEN 1 ELSE 0 END)"
+                        for group in RATING_GROUPS
+                    )}
+                FROM (
+                    SELECT
+                        rating,
+                        text,
+                        {mention} as mentioned,
+                        CASE
+                            WHEN rating >= 4.5 THEN '5_stars'
+                            WHEN rating >= 3.5 THEN '4_stars'
+                            WHEN rating >= 2.5 THEN '3_stars'
+                            WHEN rating >= 1.5 THEN '2_stars'
+                            ELSE '1_star'
+                        END as rating_group
+                    FROM reviews
+                )
             """)
-            rating_distribution = {row[0]: row[1] for row in cursor.fetchall()}
+            total_reviews, guide_mentions, avg_with_guide, avg_without_guide, *group_counts = (
+                cursor.fetchone()
+            )
+            total_reviews = total_reviews or 0
+            guide_mentions = guide_mentions or 0
+            avg_with_guide = avg_with_guide or 0
+            avg_without_guide = avg_without_guide or 0
+            rating_distribution = {
+                group: count for group, count in zip(RATING_GROUPS, group_counts) if count
+            }
 
-            # Get all review texts for quality analysis
-            cursor.execute("""
-                SELECT text, rating, operator_name, guide_names_mentioned
+            # Only the regex-based quality and sentiment checks need the text in Python
+            cursor.execute(f"""
+                SELECT text, operator_name
                 FROM reviews
-                WHERE text IS NOT NULL
-                AND (LOWER(text) LIKE '%guide%' OR LOWER(text) LIKE '%driver%')
+                WHERE text IS NOT NULL AND {mention}
             """)
-            reviews_with_guides = cursor.fetchall()
-
-            # Quality patterns to extract
-            quality_patterns = [
-                (r'\b(knowledgeable|knowledge)\b', 'Knowledgeable'),
-                (r'\b(experienced|experience)\b', 'Experienced'),
-                (r'\b(friendly|warm|welcoming)\b', 'Friendly'),
-                (r'\b(professional|professionalism)\b', 'Professional'),
-                (r'\b(helpful|accommodating)\b', 'Helpful'),
-                (r'\b(patient|patience)\b', 'Patient'),
-                (r'\b(informative|explained|explaining)\b', 'Informative'),
-                (r'\b(punctual|on time|timely)\b', 'Punctual'),
-                (r'\b(safe|safety|careful)\b', 'Safety-conscious'),
-                (r'\b(spot|spotting|spotted)\b', 'Wildlife Spotting'),
-                (r'\b(passionate|enthusiasm|enthusiastic)\b', 'Passionate'),
-                (r'\b(recommend|recommended)\b', 'Highly Recommended'),
-            ]
-
-            # Sentiment phrases
-            positive_phrases = [
-                'excellent guide', 'amazing guide', 'best guide', 'fantastic guide',
-                'wonderful guide', 'great guide', 'incredible guide', 'outstanding guide',
-                'our guide was amazing', 'our guide was excellent', 'our guide was fantastic',
-                'highly recommend', 'special thanks', 'shout out to', 'hats off to',
-                'couldn\'t have asked for', 'above and beyond', 'made our trip',
-                'highlight of', 'best part of'
-            ]
 
-            negative_phrases = [
-                'poor guide', 'bad guide', 'disappointing guide', 'guide was rude',
-                'unprofessional', 'inexperienced', 'guide didn\'t', 'guide was late',
-                'wouldn\'t recommend', 'not happy with'
-            ]
-
-            # Analyze reviews
             quality_counts = Counter()
             positive_count = 0
             negative_count = 0
             neutral_count = 0
-            operator_guide_scores = {}
-            named_guides = Counter()
+            operator_positive = Counter()
 
-            for text, rating, operator, guides_json in reviews_with_guides:
+            for text, operator in cursor:
                 if not text:
                     continue
                 text_lower = text.lower()
 
-                # Count qualities
-                for pattern, quality in quality_patterns:
-                    if re.search(pattern, text_lower):
-                        quality_counts[quality] += 1
+                # Count qualities once per review, in table order so ties in
+                # most_common keep their order
+                found = {match.lastgroup for match in GUIDE_QUALITY_RE.finditer(text_lower)}
+                quality_counts.update(
+                    quality for group, quality in GUIDE_QUALITY_GROUPS if group in found
+                )
 
                 # Sentiment analysis
-                has_positive = any(phrase in text_lower for phrase in positive_phrases)
-                has_negative = any(phrase in text_lower for phrase in negative_phrases)
+                has_positive = GUIDE_POSITIVE_RE.search(text_lower) is not None
+                has_negative = GUIDE_NEGATIVE_RE.search(text_lower) is not None
 
                 if has_positive and not has_negative:
                     positive_count += 1
@@ -461,46 +980,50 @@ class Database:
                 else:
                     neutral_count += 1
 
-                # Operator scores
-                if operator:
-                    if operator not in operator_guide_scores:
-                        operator_guide_scores[operator] = {'total': 0, 'sum': 0, 'positive': 0}
-                    operator_guide_scores[operator]['total'] += 1
-                    operator_guide_scores[operator]['sum'] += rating or 0
-                    if has_positive:
-                        operator_guide_scores[operator]['positive'] += 1
-
-                # Named guides (filter out common false positives)
-                false_positives = {'who', 'you', 'and', 'the', 'our', 'we', 'they', 'he', 'she',
-                                   'it', 'was', 'were', 'been', 'being', 'have', 'has', 'had',
-                                   'success', 'gave', 'made', 'took', 'got', 'went', 'came'}
-                if guides_json:
-                    try:
-                        guides = json.loads(guides_json) if isinstance(guides_json, str) else guides_json
-                        for guide in guides:
-                            if guide and len(guide) > 2 and guide.lower() not in false_positives:
-                                named_guides[guide] += 1
-                    except:
-                        pass
-
-            # Calculate operator rankings
-            operator_rankings = []
-            for op, scores in operator_guide_scores.items():
-                if scores['total'] >= 5:  # Minimum 5 reviews
-                    avg_rating = scores['sum'] / scores['total']
-                    positive_rate = (scores['positive'] / scores['total']) * 100
-                    operator_rankings.append({
-                        'operator': op,
-                        'reviews_with_guides': scores['total'],
-                        'avg_rating': round(avg_rating, 2),
-                        'positive_rate': round(positive_rate, 1)
-                    })
+                if operator and has_positive:
+                    operator_positive[operator] += 1
+
+            # Operator rollup, in order of each operator's first review
+            cursor.execute(f"""
+                SELECT operator_name, COUNT(*), SUM(COALESCE(rating, 0))
+                FROM reviews
+                WHERE text IS NOT NULL AND text != ''
+                AND operator_name IS NOT NULL AND operator_name != ''
+                AND {mention}
+                GROUP BY operator_name
+                HAVING COUNT(*) >= 5
+                ORDER BY MIN(id)
+            """)  # Minimum 5 reviews
+            operator_rankings = [
+                {
+                    'operator': op,
+                    'reviews_with_guides': total,
+                    'avg_rating': round(rating_sum / total, 2),
+                    'positive_rate': round(operator_positive[op] / total * 100, 1),
+                }
+                for op, total, rating_sum in cursor.fetchall()
+            ]
 
             operator_rankings.sort(key=lambda x: (x['positive_rate'], x['avg_rating']), reverse=True)
 
-            # Top guides
+            # Top guides, unpacked from the JSON name lists with json_each
+            # (filtering out common false positives). Most lists are empty,
+            # and the text comparison skips those before any JSON parsing
+            cursor.execute(f"""
+                SELECT g.value, COUNT(*) as mentions
+                FROM reviews, json_each(reviews.guide_names_mentioned) g
+                WHERE text IS NOT NULL AND text != ''
+                AND guide_names_mentioned != '[]'
+                AND json_valid(guide_names_mentioned)
+                AND {mention}
+                AND g.type = 'text' AND length(g.value) > 2
+                AND lower(g.value) NOT IN ({', '.join('?' * len(GUIDE_NAME_FALSE_POSITIVES))})
+                GROUP BY g.value
+                ORDER BY mentions DESC, MIN(reviews.id)
+                LIMIT 20
+            """, sorted(GUIDE_NAME_FALSE_POSITIVES))
             top_guides = [{'name': name, 'mentions': count}
-                          for name, count in named_guides.most_common(20)]
+                          for name, count in cursor.fetchall()]
 
             # Quality breakdown for chart
             qualities = [{'quality': q, 'count': c}
@@ -529,63 +1052,37 @@ class Database:
 
     def export_to_csv(self, output_path: str):
         """Export all data to CSV files."""
-        import pandas as pd
+        import csv
 
         output_dir = Path(output_path)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         with self._get_connection() as conn:
-            # Export reviews
-            df_reviews = pd.read_sql_query("SELECT * FROM reviews", conn)
-            df_reviews.to_csv(output_dir / "reviews.csv", index=False)
-
-            # Export guide analysis
-            df_guides = pd.read_sql_query("SELECT * FROM guide_analysis", conn)
-            df_guides.to_csv(output_dir / "guide_analysis.csv", index=False)
-
-            # Export decision factors
-            df_factors = pd.read_sql_query("SELECT * FROM decision_factors", conn)
-            df_factors.to_csv(output_dir / "decision_factors.csv", index=False)
-
-            # Export demographics
-            df_demo = pd.read_sql_query("SELECT * FROM demographics", conn)
-            df_demo.to_csv(output_dir / "demographics.csv", index=False)
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples; the writer needs nothing more
+            for table in EXPORT_TABLES:
+                # Rows stream from the cursor straight into the writer
+                cursor.execute(f"SELECT * FROM {table}")
+                with open(output_dir / f"{table}.csv", "w", newline="") as f:
+                    writer = csv.writer(f, lineterminator="\n")
+                    writer.writerow(column[0] for column in cursor.description)
+                    writer.writerows(cursor)
 
         return output_dir
 
     def export_to_json(self, output_path: str):
         """Export all data to JSON files."""
-        import json
-
         output_dir = Path(output_path)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
-
-            # Export reviews
-            cursor.execute("SELECT * FROM reviews")
-            reviews = [dict(row) for row in cursor.fetchall()]
-            with open(output_dir / "reviews.json", "w") as f:
-                json.dump(reviews, f, indent=2)
-
-            # Export guide analysis
-            cursor.execute("SELECT * FROM guide_analysis")
-            guides = [dict(row) for row in cursor.fetchall()]
-            with open(output_dir / "guide_analysis.json", "w") as f:
-                json.dump(guides, f, indent=2)
-
-            # Export decision factors
-            cursor.execute("SELECT * FROM decision_factors")
-            factors = [dict(row) for row in cursor.fetchall()]
-            with open(output_dir / "decision_factors.json", "w") as f:
-                json.dump(factors, f, indent=2)
-
-            # Export demographics
-            cursor.execute("SELECT * FROM demographics")
-            demo = [dict(row) for row in cursor.fetchall()]
-            with open(output_dir / "demographics.json", "w") as f:
-                json.dump(demo, f, indent=2)
+            cursor.row_factory = None  # Plain tuples, zipped with the column names once per table
+            for table in EXPORT_TABLES:
+                cursor.execute(f"SELECT * FROM {table}")
+                columns = [column[0] for column in cursor.description]
+                with open(output_dir / f"{table}.json", "wb") as f:
+                    _write_json_array(f, (dict(zip(columns, row)) for row in cursor))
 
         return output_dir
 
@@ -614,29 +1111,16 @@ class Database:
 
             updates = []
             values = []
+            for key, value in kwargs.items():
+                column = SCRAPE_RUN_UPDATE_COLUMNS.get(key)
+                if column is None:
+                    continue
+                updates.append(f"{column} = ?")
+                values.append(json.dumps(value) if key == 'errors' else value)
 
-            if 'status' in kwargs:
-                updates.append("status = ?")
-                values.append(kwargs['status'])
-                if kwargs['status'] in ('completed', 'stopped', 'failed'):
-                    updates.append("ended_at = ?")
-                    values.append(datetime.now().isoformat())
-
-            if 'operators_total' in kwargs:
-                updates.append("operators_total = ?")
-                values.append(kwargs['operators_total'])
-
-            if 'operators_completed' in kwargs:
-                updates.append("operators_completed = ?")
-                values.append(kwargs['operators_completed'])
-
-            if 'reviews_collected' in kwargs:
-                updates.append("reviews_collected = ?")
-                values.append(kwargs['reviews_collected'])
-
-            if 'errors' in kwargs:
-                updates.append("errors_json = ?")
-                values.append(json.dumps(kwargs['errors']))
+            if kwargs.get('status') in FINISHED_RUN_STATUSES:
+                updates.append("ended_at = ?")
+                values.append(datetime.now().isoformat())
 
             if updates:
                 values.append(run_id)
@@ -649,15 +1133,20 @@ class Database:
         """Get recent scrape runs."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples, zipped with the column names once
             cursor.execute("""
                 SELECT * FROM scrape_runs ORDER BY started_at DESC LIMIT ?
             """, (limit,))
-            return [dict(row) for row in cursor.fetchall()]
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
     def get_scrape_run(self, run_id: int) -> Optional[dict]:
         """Get a specific scrape run."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute("SELECT * FROM scrape_runs WHERE id = ?", (run_id,))
             row = cursor.fetchone()
-            return dict(row) if row else None
+            if row is None:
+                return None
+            return dict(zip((column[0] for column in cursor.description), row))
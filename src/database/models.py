@@ -1,11 +1,12 @@
 """Database models for safari reviews."""
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Optional
-import json
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class Review:
     """Represents a safari review from any source."""
     id: Optional[int] = None
@@ -43,6 +44,9 @@ class Review:
     raw_text_block: str = ""  # Original unparsed text block
     parse_warnings: str = "[]"  # JSON list of parsing issues
 
+    # Decoded JSON list fields, as {field: (raw string, list)}
+    _json_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -75,30 +79,47 @@ class Review:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Review":
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        return cls(**{k: v for k, v in data.items() if k in REVIEW_INIT_FIELDS})
+
+    def _json_list(self, name: str, raw: str) -> list:
+        """Decode a JSON list field once, re-decoding only after the field is reassigned.
+
+        The returned list is shared between calls and must not be mutated.
+        """
+        cache = self._json_cache
+        if cache is None:
+            cache = self._json_cache = {}
+        entry = cache.get(name)
+        if entry is None or entry[0] is not raw:
+            entry = cache[name] = (raw, orjson.loads(raw) if raw else [])
+        return entry[1]
 
     @property
     def wildlife_list(self) -> list:
         """Get wildlife sightings as a list."""
-        return json.loads(self.wildlife_sightings) if self.wildlife_sightings else []
+        return self._json_list("wildlife_sightings", self.wildlife_sightings)
 
     @property
     def guide_names_list(self) -> list:
         """Get guide names as a list."""
-        return json.loads(self.guide_names_mentioned) if self.guide_names_mentioned else []
+        return self._json_list("guide_names_mentioned", self.guide_names_mentioned)
 
     @property
     def parks_list(self) -> list:
         """Get parks visited as a list."""
-        return json.loads(self.parks_visited) if self.parks_visited else []
+        return self._json_list("parks_visited", self.parks_visited)
 
     @property
     def warnings_list(self) -> list:
         """Get parse warnings as a list."""
-        return json.loads(self.parse_warnings) if self.parse_warnings else []
+        return self._json_list("parse_warnings", self.parse_warnings)
+
+
+# Fields Review.__init__ accepts, for filtering from_dict input
+REVIEW_INIT_FIELDS = frozenset(f.name for f in fields(Review) if f.init)
 
 
-@dataclass
+@dataclass(slots=True)
 class GuideAnalysis:
     """Analysis of guide mentions in a review."""
     id: Optional[int] = None
@@ -124,14 +145,14 @@ class GuideAnalysis:
 
     @property
     def guide_names_list(self) -> list:
-        return json.loads(self.guide_names)
+        return orjson.loads(self.guide_names)
 
     @property
     def keywords_list(self) -> list:
-        return json.loads(self.guide_keywords_found)
+        return orjson.loads(self.guide_keywords_found)
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionFactor:
     """Purchasing decision factors extracted from a review."""
     id: Optional[int] = None
@@ -152,7 +173,7 @@ class DecisionFactor:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Demographic:
     """Demographic information extracted from a review/reviewer."""
     id: Optional[int] = None
@@ -1,6 +1,6 @@
 """Scrapers for safari review sites."""
-from .base import BaseScraper
+from .base import AdaptiveLimiter, BaseScraper
 from .safaribookings import SafaribookingsScraper
 from .tripadvisor import TripAdvisorScraper
 
-__all__ = ["BaseScraper", "SafaribookingsScraper", "TripAdvisorScraper"]
+__all__ = ["AdaptiveLimiter", "BaseScraper", "SafaribookingsScraper", "TripAdvisorScraper"]
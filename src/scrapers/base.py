@@ -1,14 +1,17 @@
 """Base scraper class with common functionality."""
 import asyncio
+import os
 import random
-import json
+import tempfile
 import time
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from pathlib import Path
-from typing import Optional, Callable, TypeVar
+from typing import Awaitable, ClassVar, Optional, Callable, TypeVar
 from datetime import datetime
 from functools import wraps
 
+import orjson
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeout
 
 
@@ -61,42 +64,155 @@ def retry_on_network_error(max_retries: int = 3, base_delay: float = 2.0):
     return decorator
 
 
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to rate limiting (additive increase, multiplicative decrease).
+
+    The window grows by one after a full window of successes and halves
+    when a task raises the overload exception, which is then retried after
+    a backoff. Tasks already in flight when the window shrinks don't shrink
+    it again, so one burst of throttling counts as a single overload.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        min_concurrency: int = 1,
+        initial_concurrency: int = 4,
+        overload_exception: type[Exception] = RateLimitError,
+        max_retries: int = 3,
+        backoff: float = 5.0,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = max(min_concurrency, min(initial_concurrency, max_concurrency))
+        self.overload_exception = overload_exception
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._active = 0
+        self._successes = 0
+        self._generation = 0  # Bumped on every decrease
+        self._changed = asyncio.Condition()
+
+    async def run(self, task: Callable[[], Awaitable[T]]) -> T:
+        """Run task() once a slot is free, retrying it on overload."""
+        for attempt in range(self.max_retries + 1):
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._active < self.limit)
+                self._active += 1
+                generation = self._generation
+
+            try:
+                result = await task()
+            except self.overload_exception:
+                await self._release(overloaded=generation == self._generation)
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.backoff * (2 ** attempt) + random.uniform(0, 1))
+            except BaseException:
+                await self._release(overloaded=False)
+                raise
+            else:
+                await self._release(overloaded=False)
+                return result
+
+        raise AssertionError("unreachable")
+
+    async def _release(self, overloaded: bool):
+        async with self._changed:
+            self._active -= 1
+            if overloaded:
+                limit = max(self.min_concurrency, self.limit // 2)
+                if limit < self.limit:
+                    print(f"  Rate limit detected, reducing concurrency to {limit}")
+                self.limit = limit
+                self._successes = 0
+                self._generation += 1
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self._successes = 0
+            self._changed.notify_all()
+
+
+# Delay multiplier once more than each threshold of operators has been
+# scraped, to avoid rate limiting on long runs (reduced for speed; were
+# 1.5x past 50, 2.0x past 100 and 2.5x past 200)
+DELAY_THRESHOLDS = (100, 200)
+DELAY_MULTIPLIERS = (1.0, 1.25, 1.5)
+
+
 class ScraperState:
-    """Manages scraper state for pause/resume functionality."""
+    """Manages scraper state for pause/resume functionality.
+
+    The state file is mirrored in memory and only re-read when another
+    writer (a second scraper, or a clear from the web UI) has replaced it.
+    Saves write compact JSON to a temporary file and swap it in, so
+    readers never see a partial checkpoint.
+    """
+
+    # State directories already created by this process
+    _dirs_created: ClassVar[set[Path]] = set()
 
     def __init__(self, state_file: str = "data/scraper_state.json"):
         self.state_file = Path(state_file)
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        parent = self.state_file.parent
+        if parent not in self._dirs_created:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._dirs_created.add(parent)
+        self._state: dict = {}
+        self._signature: Optional[tuple] = None  # File identity when _state was read or written
 
     def save(self, scraper_name: str, data: dict):
         """Save scraper state."""
-        state = self.load_all()
+        state = self._current()
         state[scraper_name] = {
             **data,
             "updated_at": datetime.now().isoformat()
         }
-        with open(self.state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        self._write(state)
 
     def load(self, scraper_name: str) -> Optional[dict]:
         """Load scraper state."""
-        state = self.load_all()
-        return state.get(scraper_name)
+        return self._current().get(scraper_name)
 
     def load_all(self) -> dict:
         """Load all scraper states."""
-        if self.state_file.exists():
-            with open(self.state_file) as f:
-                return json.load(f)
-        return {}
+        return dict(self._current())
 
     def clear(self, scraper_name: str):
         """Clear scraper state."""
-        state = self.load_all()
+        state = self._current()
         if scraper_name in state:
             del state[scraper_name]
-            with open(self.state_file, "w") as f:
-                json.dump(state, f, indent=2)
+            self._write(state)
+
+    def _file_signature(self) -> Optional[tuple]:
+        try:
+            stat = self.state_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _current(self) -> dict:
+        """The in-memory state, reloaded if the file changed since it was last seen."""
+        signature = self._file_signature()
+        if signature != self._signature:
+            self._state = orjson.loads(self.state_file.read_bytes()) if signature else {}
+            self._signature = signature
+        return self._state
+
+    def _write(self, state: dict):
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(state))
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.state_file)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self._signature = self._file_signature()
 
 
 class BaseScraper(ABC):
@@ -111,11 +227,13 @@ class BaseScraper(ABC):
         min_delay: float = 0.5,  # Reduced from 2.0 for faster scraping
         max_delay: float = 1.5,  # Reduced from 5.0 for faster scraping
         timeout: int = 60000,  # Increased from 30s to 60s
+        limiter: Optional[AdaptiveLimiter] = None,  # Enables concurrent operator scraping
     ):
         self.headless = headless
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.timeout = timeout
+        self.limiter = limiter
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
         self.state = ScraperState()
@@ -199,18 +317,9 @@ class BaseScraper(ABC):
         # Base delay
         base_delay = random.uniform(self.min_delay, self.max_delay)
 
-        # Increase delay based on how many operators we've scraped
-        # This helps avoid rate limiting on long runs (reduced multipliers for speed)
-        if self.operators_scraped > 200:
-            multiplier = 1.5  # Was 2.5
-        elif self.operators_scraped > 100:
-            multiplier = 1.25  # Was 2.0
-        elif self.operators_scraped > 50:
-            multiplier = 1.0  # Was 1.5
-        else:
-            multiplier = 1.0
-
-        # Apply any rate limit multiplier from detected slowdowns
+        # Increase delay based on how many operators we've scraped, and apply
+        # any rate limit multiplier from detected slowdowns
+        multiplier = DELAY_MULTIPLIERS[bisect_left(DELAY_THRESHOLDS, self.operators_scraped)]
         multiplier *= self._rate_limit_multiplier
 
         delay = base_delay * multiplier
@@ -276,6 +385,13 @@ class BaseScraper(ABC):
         await self.random_delay()
         return True
 
+    @staticmethod
+    async def publish_reviews(reviews: list, queue: Optional[asyncio.Queue]):
+        """Pass freshly scraped reviews to a consumer, if one is listening."""
+        if queue is not None:
+            for review in reviews:
+                await queue.put(review)
+
     def save_progress(self, data: dict):
         """Save current progress for resume, including network state."""
         # Include network state for proper resume
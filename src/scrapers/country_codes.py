@@ -1,4 +1,5 @@
 """Complete ISO 3166-1 alpha-2 country code mapping."""
+from functools import lru_cache
 
 # Comprehensive country code to full name mapping
 # Includes all major markets and safari source countries
@@ -250,6 +251,8 @@ REGION_MAPPING = {
 }
 
 
+# The scrapers resolve the same few codes for every review
+@lru_cache(maxsize=1024)
 def get_country_name(code: str) -> str:
     """Get full country name from ISO code."""
     if not code:
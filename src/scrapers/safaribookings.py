@@ -3,12 +3,13 @@ import asyncio
 import json
 import random
 import re
+from contextlib import aclosing
 from typing import Optional, AsyncIterator
 from urllib.parse import urljoin
 
 from playwright.async_api import Page, ElementHandle
 
-from .base import BaseScraper
+from .base import BaseScraper, RateLimitError
 from .country_codes import COUNTRY_CODES, get_country_name, get_region
 from .validation import ReviewValidator, ParsingErrorTracker, ParseResult
 from ..database.models import Review
@@ -90,6 +91,10 @@ GUIDE_PATTERNS = [
 GUIDE_NAME_BLACKLIST = frozenset(["the", "our", "was", "had", "very", "really", "great", "amazing"])
 
 
+# Response codes that mean the site is throttling us
+RATE_LIMIT_STATUSES = frozenset({429, 503})
+
+
 class SafaribookingsScraper(BaseScraper):
     """Scraper for Safaribookings.com safari reviews with enhanced data extraction."""
 
@@ -301,23 +306,36 @@ class SafaribookingsScraper(BaseScraper):
 
         Uses fast HTTP method by default (10-20x faster), with browser fallback.
         """
+        return [url async for url in self.iter_operator_urls(max_pages)]
+
+    async def iter_operator_urls(self, max_pages: int = 10) -> AsyncIterator[str]:
+        """Yield safari operator URLs from Safaribookings as they are discovered.
+
+        Over HTTP each batch of listing pages is yielded before the next is
+        fetched, so callers can start on operators while discovery runs.
+        The browser fallback yields once its crawl is done.
+        """
         import sys
 
+        found = 0
+
         # Try fast HTTP method first (much faster than browser)
         try:
-            from .http_helper import fetch_operator_urls_fast, is_http_available
+            from .http_helper import is_http_available, iter_operator_urls
             if is_http_available():
                 print(f"[HTTP] Attempting fast HTTP operator discovery...", flush=True)
                 sys.stdout.flush()
-                operators = await fetch_operator_urls_fast(
+                async for url in iter_operator_urls(
                     base_url=self.BASE_URL,
                     max_pages=max_pages,
                     timeout=30.0
-                )
-                if operators:
-                    print(f"[HTTP] Success! Found {len(operators)} operators via HTTP", flush=True)
+                ):
+                    found += 1
+                    yield url
+                if found:
+                    print(f"[HTTP] Success! Found {found} operators via HTTP", flush=True)
                     sys.stdout.flush()
-                    return operators
+                    return
                 print("[HTTP] No operators found, falling back to browser...", flush=True)
                 sys.stdout.flush()
         except ImportError as e:
@@ -329,10 +347,16 @@ class SafaribookingsScraper(BaseScraper):
             print(f"[HTTP] Traceback: {traceback.format_exc()}", flush=True)
             sys.stdout.flush()
 
+        if found:
+            # URLs already handed out can't be taken back; the browser crawl
+            # would only repeat them
+            return
+
         # Fallback to browser-based method
         print("[HTTP] Using browser fallback for operator discovery...", flush=True)
         sys.stdout.flush()
-        return await self._get_operator_urls_browser(max_pages)
+        for url in await self._get_operator_urls_browser(max_pages):
+            yield url
 
     async def _get_operator_urls_browser(self, max_pages: int = 10) -> list[str]:
         """Get operator URLs using browser (fallback method)."""
@@ -557,12 +581,15 @@ class SafaribookingsScraper(BaseScraper):
 
         # Navigate using the provided page
         try:
-            await page.goto(reviews_url, wait_until="domcontentloaded", timeout=self.timeout)
+            response = await page.goto(reviews_url, wait_until="domcontentloaded", timeout=self.timeout)
             await asyncio.sleep(0.5)  # Reduced wait time
         except Exception as e:
             print(f"  Failed to load {reviews_url}: {e}")
             return reviews
 
+        if response and response.status in RATE_LIMIT_STATUSES:
+            raise RateLimitError(f"HTTP {response.status} loading {reviews_url}")
+
         # Dismiss cookies on this page
         await self._dismiss_cookie_popup(page)
 
@@ -1054,8 +1081,13 @@ class SafaribookingsScraper(BaseScraper):
         max_reviews_per_operator: int = 50,
         resume: bool = True,
         max_operator_pages: int = 20,
+        queue: Optional[asyncio.Queue] = None,
     ) -> list[Review]:
-        """Scrape reviews from multiple operators with enhanced tracking."""
+        """Scrape reviews from multiple operators with enhanced tracking.
+
+        If queue is given, each operator's reviews are put on it as soon as
+        they are scraped.
+        """
         all_reviews = []
         processed_urls = set()
 
@@ -1070,44 +1102,49 @@ class SafaribookingsScraper(BaseScraper):
 
         try:
             print("Fetching operator URLs...")
-            operator_urls = await self.get_operator_urls(max_pages=max_operator_pages)
-            print(f"Found {len(operator_urls)} operators")
+            if self.limiter:
+                # Operators are dispatched as discovery yields them
+                await self._scrape_operators_concurrently(
+                    self.iter_operator_urls(max_pages=max_operator_pages),
+                    max_operators, max_reviews_per_operator,
+                    processed_urls, all_reviews, queue,
+                )
+            else:
+                operator_urls = await self.get_operator_urls(max_pages=max_operator_pages)
+                print(f"Found {len(operator_urls)} operators")
 
-            for i, url in enumerate(operator_urls[:max_operators]):
-                if self._stop_requested:
-                    break
+                for i, url in enumerate(operator_urls[:max_operators]):
+                    if self._stop_requested:
+                        break
 
-                if url in processed_urls:
-                    continue
+                    if url in processed_urls:
+                        continue
 
-                print(f"[{i+1}/{min(len(operator_urls), max_operators)}] Scraping: {url}")
+                    print(f"[{i+1}/{min(len(operator_urls), max_operators)}] Scraping: {url}")
 
-                try:
-                    reviews = await self.scrape_reviews(url, max_reviews=max_reviews_per_operator)
-                    all_reviews.extend(reviews)
-                    print(f"  Found {len(reviews)} reviews (total: {len(all_reviews)})")
-                except Exception as e:
-                    print(f"  Error: {e}")
+                    try:
+                        reviews = await self.scrape_reviews(url, max_reviews=max_reviews_per_operator)
+                        all_reviews.extend(reviews)
+                        await self.publish_reviews(reviews, queue)
+                        print(f"  Found {len(reviews)} reviews (total: {len(all_reviews)})")
+                    except Exception as e:
+                        print(f"  Error: {e}")
 
-                processed_urls.add(url)
+                    processed_urls.add(url)
 
-                self.save_progress({
-                    "processed_urls": list(processed_urls),
-                    "total_reviews": len(all_reviews),
-                })
+                    self.save_progress({
+                        "processed_urls": list(processed_urls),
+                        "total_reviews": len(all_reviews),
+                    })
 
-                # Adaptive rate limiting - slower after many requests
-                if i > 50:
-                    await asyncio.sleep(self.max_delay * 1.5)
-                else:
-                    await self.random_delay()
+                    await self._operator_delay(i)
 
-                # Print parsing stats every 10 operators
-                if (i + 1) % 10 == 0:
-                    report = self.get_parsing_report()
-                    print(f"  [Parsing stats: {report['stats']['successful']} OK, "
-                          f"{report['stats']['failed']} failed, "
-                          f"{report['stats']['low_confidence']} low confidence]")
+                    # Print parsing stats every 10 operators
+                    if (i + 1) % 10 == 0:
+                        report = self.get_parsing_report()
+                        print(f"  [Parsing stats: {report['stats']['successful']} OK, "
+                              f"{report['stats']['failed']} failed, "
+                              f"{report['stats']['low_confidence']} low confidence]")
 
         finally:
             await self.stop()
@@ -1118,6 +1155,74 @@ class SafaribookingsScraper(BaseScraper):
 
         return all_reviews
 
+    async def _operator_delay(self, i: int):
+        """Wait between operators; i is the operator's position in the run."""
+        # Adaptive rate limiting - slower after many requests
+        if i > 50:
+            await asyncio.sleep(self.max_delay * 1.5)
+        else:
+            await self.random_delay()
+
+    async def _scrape_operators_concurrently(
+        self,
+        operator_urls: AsyncIterator[str],
+        max_operators: int,
+        max_reviews_per_operator: int,
+        processed_urls: set[str],
+        all_reviews: list[Review],
+        queue: Optional[asyncio.Queue] = None,
+    ):
+        """Scrape operators in isolated browser contexts, bounded by self.limiter.
+
+        Each operator is scheduled as soon as operator_urls yields it, so
+        scraping overlaps with fetching the remaining listing pages.
+        """
+        if not self.browser:
+            await self.start()
+
+        async def scrape_operator(i: int, url: str) -> list[Review]:
+            context, page = await self.create_context()
+            try:
+                reviews = await self.scrape_reviews_with_page(
+                    url, page, max_reviews=max_reviews_per_operator
+                )
+            finally:
+                await context.close()
+
+            # Hold the slot through the same pause the sequential loop takes,
+            # so each slot paces its requests like a sequential scraper
+            await self._operator_delay(i)
+            return reviews
+
+        async def worker(i: int, url: str):
+            if self._stop_requested or url in processed_urls:
+                return
+
+            print(f"[{i+1}/{max_operators}] Scraping: {url}")
+            try:
+                reviews = await self.limiter.run(lambda: scrape_operator(i, url))
+                all_reviews.extend(reviews)
+                await self.publish_reviews(reviews, queue)
+                print(f"  Found {len(reviews)} reviews (total: {len(all_reviews)})")
+            except Exception as e:
+                print(f"  Error: {e}")
+
+            processed_urls.add(url)
+            self.save_progress({
+                "processed_urls": list(processed_urls),
+                "total_reviews": len(all_reviews),
+            })
+
+        tasks = []
+        async with aclosing(operator_urls):
+            async for url in operator_urls:
+                if self._stop_requested or len(tasks) >= max_operators:
+                    break
+                tasks.append(asyncio.create_task(worker(len(tasks), url)))
+
+        print(f"Dispatched {len(tasks)} operators")
+        await asyncio.gather(*tasks)
+
     async def scrape_all_batched(
         self,
         max_operators: int = 100,
@@ -562,8 +562,13 @@ class TripAdvisorScraper(BaseScraper):
         max_operators: int = 50,
         max_reviews_per_operator: int = 50,
         resume: bool = True,
+        queue: Optional[asyncio.Queue] = None,
     ) -> list[Review]:
-        """Scrape reviews from multiple regions."""
+        """Scrape reviews from multiple regions.
+
+        If queue is given, each attraction's reviews are put on it as soon
+        as they are scraped.
+        """
         regions = regions or ["kenya", "tanzania"]
         all_reviews = []
         processed_urls = set()
@@ -598,6 +603,7 @@ class TripAdvisorScraper(BaseScraper):
                     try:
                         reviews = await self.scrape_reviews(url, max_reviews=max_reviews_per_operator)
                         all_reviews.extend(reviews)
+                        await self.publish_reviews(reviews, queue)
                         print(f"  Found {len(reviews)} reviews (total: {len(all_reviews)})")
                     except Exception as e:
                         print(f"  Error: {e}")
@@ -311,12 +311,10 @@ class ScraperRunner:
                                 existing_urls=existing_urls  # Pass existing URLs to skip duplicates
                             )
 
-                            # Save reviews to database and count new ones
-                            new_reviews = 0
-                            for review in reviews:
-                                if review.url not in existing_urls:
-                                    db.insert_review(review)
-                                    new_reviews += 1
+                            # Save new reviews to database in one transaction
+                            fresh = [r for r in reviews if r.url not in existing_urls]
+                            db.insert_reviews(fresh)
+                            new_reviews = len(fresh)
 
                             completed_count += 1
                             total_reviews += new_reviews  # Only count NEW reviews